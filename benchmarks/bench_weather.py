@@ -0,0 +1,333 @@
+"""Benchmarks for the public functions in weather.py.
+
+Generates synthetic station data of increasing size, times each function,
+records throughput and peak memory, and compares the results with a saved
+baseline so that regressions are caught.
+
+Usage:
+    python benchmarks/bench_weather.py                      # run and compare with the baseline
+    python benchmarks/bench_weather.py --save-baseline      # run and save a new baseline
+    python benchmarks/bench_weather.py --sizes 10 1000 10000000
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# Make weather.py importable when running from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather
+
+# Sizes (in rows) benchmarked when none are given
+DEFAULT_SIZES = [10, 1000, 100000, 1000000]
+
+# Where the baseline results are kept
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Slowdown (or extra memory) allowed before a result counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Above this many rows peak memory is not measured, as tracemalloc slows things down a lot
+MEMORY_SIZE_LIMIT = 1000000
+
+# Startup budget (seconds): time "import weather" adds to a bare interpreter,
+# and the whole of "python -m weather summary" on a small file
+IMPORT_BUDGET = 0.040
+CLI_BUDGET = 0.100
+
+# The directory weather.py lives in
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def generate_csv(path, rows, seed=0):
+    """Writes a synthetic weather csv file.
+
+    Args:
+        path: Where to write the csv file.
+        rows: The number of days of data to generate.
+        seed: The random seed, so the same data is generated every run.
+    """
+
+    generator = random.Random(seed)
+    start = datetime(1900, 1, 1, 7)
+    with open(path, "w", newline="") as csv_file:
+        csv_file.write("date,min,max\n")
+        for day in range(rows):
+            date = (start + timedelta(days=day % 2900000)).isoformat()
+            low = generator.randint(-40, 90)
+            csv_file.write(f"{date}+08:00,{low},{low + generator.randint(0, 30)}\n")
+
+
+def benchmark_cases(csv_file):
+    """Lists the functions to benchmark for one dataset.
+
+    Args:
+        csv_file: The path of the synthetic csv file.
+    Returns:
+        A list of (name, function) pairs. Each function takes no arguments.
+    """
+
+    data = weather.load_data_from_csv(csv_file, fast=True)
+    min_temps = [row[1] for row in data]
+    max_temps = [row[2] for row in data]
+    return [
+        ("load_data_from_csv", lambda: weather.load_data_from_csv(csv_file)),
+        ("find_min", lambda: weather.find_min(min_temps)),
+        ("find_max", lambda: weather.find_max(max_temps)),
+        ("calculate_mean", lambda: weather.calculate_mean(min_temps)),
+        ("generate_summary", lambda: weather.generate_summary(data)),
+        ("generate_daily_summary", lambda: weather.generate_daily_summary(data)),
+    ]
+
+
+def time_call(function, repeats):
+    """Times a function, keeping the best of several runs.
+
+    Args:
+        function: The function to call.
+        repeats: How many times to run it.
+    Returns:
+        The fastest run time in seconds.
+    """
+
+    best = None
+    for _ in range(repeats):
+        weather.clear_date_cache()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def peak_memory(function):
+    """Measures the peak memory allocated while a function runs.
+
+    Args:
+        function: The function to call.
+    Returns:
+        The peak number of bytes allocated.
+    """
+
+    weather.clear_date_cache()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def retained_bytes(build):
+    """Measures how much memory the object built by a function keeps alive.
+
+    Args:
+        build: A function that builds and returns an object.
+    Returns:
+        The number of bytes still allocated while the object exists.
+    """
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        retained = tracemalloc.get_traced_memory()[0] - before
+        del kept
+        return retained
+    finally:
+        tracemalloc.stop()
+
+
+def storage_cases(csv_file):
+    """Lists the row storage formats whose memory per row is compared.
+
+    Args:
+        csv_file: The path of the synthetic csv file.
+    Returns:
+        A list of (name, function) pairs. Each function builds the stored data.
+    """
+
+    return [
+        ("rows_list", lambda: weather.load_data_from_csv(csv_file, fast=True)),
+        ("rows_compact", lambda: weather.load_data_from_csv(csv_file, fast=True, compact=True)),
+    ]
+
+
+def time_process(args, repeats):
+    """Times a fresh Python process, keeping the best of several runs.
+
+    Args:
+        args: The arguments to give the Python interpreter.
+        repeats: How many times to run it.
+    Returns:
+        The fastest run time in seconds.
+    """
+
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPOSITORY, stdout=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def startup_times(repeats):
+    """Measures how long it takes to import weather and to run its command line.
+
+    Args:
+        repeats: How many times to run each measurement.
+    Returns:
+        A dict with the "startup/import" and "startup/cli" results.
+    """
+
+    bare = time_process(["-c", "pass"], repeats)
+    imported = time_process(["-c", "import weather"], repeats)
+    cli = time_process(["-m", "weather", "summary", os.path.join("tests", "data", "example_one.csv")], repeats)
+    return {
+        "startup/import": {"seconds": max(imported - bare, 0.0), "budget": IMPORT_BUDGET},
+        "startup/cli": {"seconds": cli, "budget": CLI_BUDGET},
+    }
+
+
+def over_budget(results):
+    """Finds startup results that are slower than their budget.
+
+    Args:
+        results: The results from run_benchmarks.
+    Returns:
+        A list of strings describing each result over budget.
+    """
+
+    return [
+        f"{key} seconds: {result['seconds'] * 1000:.1f} ms is over the {result['budget'] * 1000:.0f} ms budget"
+        for key, result in results.items()
+        if "budget" in result and result["seconds"] > result["budget"]
+    ]
+
+
+def run_benchmarks(sizes, repeats):
+    """Runs every benchmark for every dataset size.
+
+    Args:
+        sizes: The dataset sizes, in rows.
+        repeats: How many times to time each function.
+    Returns:
+        A dict mapping "function/rows" to a dict of seconds, rows_per_second and
+        peak_bytes, "storage/rows" to a dict of retained_bytes, and
+        "startup/..." to a dict of seconds and budget.
+    """
+
+    results = startup_times(max(repeats, 10))
+    for key, result in results.items():
+        print(f"{key:<36} {result['seconds'] * 1000:>12.3f} ms (budget {result['budget'] * 1000:.0f} ms)", flush=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in sizes:
+            csv_file = os.path.join(directory, f"weather_{rows}.csv")
+            generate_csv(csv_file, rows)
+            for name, function in benchmark_cases(csv_file):
+                seconds = time_call(function, repeats if rows < 1000000 else 1)
+                result = {
+                    "seconds": seconds,
+                    "rows_per_second": rows / seconds if seconds else None,
+                    "peak_bytes": peak_memory(function) if rows <= MEMORY_SIZE_LIMIT else None,
+                }
+                results[f"{name}/{rows}"] = result
+                print(format_result(f"{name}/{rows}", result), flush=True)
+            for name, build in storage_cases(csv_file):
+                retained = retained_bytes(build)
+                results[f"{name}/{rows}"] = {"retained_bytes": retained}
+                print(f"{name + '/' + str(rows):<36} {retained / max(rows, 1):>12.1f} bytes/row retained", flush=True)
+    return results
+
+
+def format_result(key, result):
+    """Formats one benchmark result as a line of text.
+
+    Args:
+        key: The "function/rows" benchmark name.
+        result: The dict of measurements.
+    Returns:
+        A string.
+    """
+
+    throughput = result["rows_per_second"]
+    peak = result["peak_bytes"]
+    return (
+        f"{key:<36} {result['seconds'] * 1000:>12.3f} ms "
+        f"{throughput if throughput is not None else float('nan'):>14,.0f} rows/s "
+        f"{(peak / 1048576) if peak is not None else float('nan'):>10.2f} MiB peak"
+    )
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Finds results that got slower or use more memory than the baseline.
+
+    Args:
+        results: The new results from run_benchmarks.
+        baseline: Previously saved results.
+        tolerance: The fraction of slowdown (or extra memory) allowed.
+    Returns:
+        A list of strings describing each regression.
+    """
+
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for measure in ("seconds", "peak_bytes", "retained_bytes"):
+            old, new = previous.get(measure), result.get(measure)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append(f"{key} {measure}: {old:.6g} -> {new:.6g} ({new / old - 1:+.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the functions in weather.py.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="dataset sizes in rows")
+    parser.add_argument("--repeats", type=int, default=3, help="timing runs per benchmark (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="save these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown, e.g. 0.25")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeats)
+
+    budget_failures = over_budget(results)
+    for failure in budget_failures:
+        print(f"OVER BUDGET {failure}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 1 if budget_failures else 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regressions against the baseline")
+    return 1 if regressions or budget_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
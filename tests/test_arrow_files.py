@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+import weather
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipUnless(pyarrow, "pyarrow is not installed")
+class ArrowFileTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.data = weather.load_data_from_csv("tests/data/example_two.csv")
+        self.arrow_file = os.path.join(self.directory, "weather.arrow")
+        self.parquet_file = os.path.join(self.directory, "weather.parquet")
+
+    def test_arrow_round_trip(self):
+        self.assertEqual(weather.write_arrow(iter(self.data), self.arrow_file), 8)
+        result = weather.load_data_from_arrow(self.arrow_file)
+        self.assertEqual(len(result), 8)
+        self.assertListEqual(list(result), self.data)
+        self.assertEqual(weather.generate_summary(result), weather.generate_summary(self.data))
+        self.assertEqual(weather.generate_daily_summary(result), weather.generate_daily_summary(self.data))
+
+    def test_parquet_round_trip(self):
+        self.assertEqual(weather.write_parquet(self.data, self.parquet_file, row_group_size=3), 8)
+        result = weather.load_data_from_parquet(self.parquet_file)
+        self.assertListEqual(list(result), self.data)
+        self.assertEqual(weather.generate_summary(result), weather.generate_summary(self.data))
+
+    def test_date_range(self):
+        weather.write_arrow(self.data, self.arrow_file)
+        weather.write_parquet(self.data, self.parquet_file, row_group_size=2)
+        expected_result = weather.DateIndex(self.data).between("2020-06-21", date(2020, 6, 24))
+        self.assertEqual(len(expected_result), 3)
+        for load, path in ((weather.load_data_from_arrow, self.arrow_file), (weather.load_data_from_parquet, self.parquet_file)):
+            self.assertListEqual(list(load(path, "2020-06-21", date(2020, 6, 24))), expected_result)
+        self.assertListEqual(list(weather.load_data_from_parquet(self.parquet_file, end="2020-06-19T07:00:00")), [])
+        self.assertListEqual(list(weather.load_data_from_arrow(self.arrow_file, start="2020-06-26T07:00:00")), self.data[-1:])
+
+    def test_date_range_matches_date_index(self):
+        data = [
+            ["2021-06-30", 50, 70],
+            ["2021-07-01", 51, 71],
+            ["2021-07-02", 52, 72],
+            ["2021-07-03T07:00:00+08:00", 53, 73],
+            ["2021-07-04 06:00", 54, 74],
+        ]
+        weather.write_arrow(data, self.arrow_file)
+        weather.write_parquet(data, self.parquet_file, row_group_size=1)
+        index = weather.DateIndex(data)
+        ranges = [
+            (datetime(2021, 7, 1), "2021-07-02T00:00:00"),
+            ("2021-07-01T00:00:01", None),
+            (None, date(2021, 7, 4)),
+            ("2021-07-03T07:00:00+09:00", "2021-07-04T06:00"),
+        ]
+        for start, end in ranges:
+            expected_result = index.between(start, end)
+            self.assertListEqual(list(weather.load_data_from_arrow(self.arrow_file, start, end)), expected_result)
+            self.assertListEqual(list(weather.load_data_from_parquet(self.parquet_file, start, end)), expected_result)
+        self.assertListEqual(list(weather.load_data_from_parquet(self.parquet_file, datetime(2021, 7, 1), "2021-07-02T00:00:00")), [data[1]])
+
+    def test_columns_are_zero_copy(self):
+        weather.write_arrow(self.data, self.arrow_file)
+        result = weather.load_data_from_arrow(self.arrow_file)
+        self.assertFalse(result.min_temps.flags.owndata)
+        self.assertListEqual(result.min_temps.tolist(), [row[1] for row in self.data])
+        self.assertEqual(weather.find_max(result.max_temps), weather.find_max([row[2] for row in self.data]))
+        self.assertEqual(weather.calculate_mean(result.min_temps), weather.calculate_mean([row[1] for row in self.data]))
+
+    def test_float_temperatures(self):
+        data = [["2021-07-01", 50.5, 70], ["2021-07-02", 51, 71.25]]
+        weather.write_parquet(data, self.parquet_file)
+        self.assertListEqual(list(weather.load_data_from_parquet(self.parquet_file)), [["2021-07-01", 50.5, 70], ["2021-07-02", 51.0, 71.25]])
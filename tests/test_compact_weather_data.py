@@ -0,0 +1,63 @@
+import unittest
+import weather
+
+
+class CompactWeatherDataTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_three = weather.load_data_from_csv("tests/data/example_three.csv")
+
+    def test_compact_rows(self):
+        compact = weather.load_data_from_csv("tests/data/example_three.csv", compact=True)
+        self.assertIsInstance(compact, weather.CompactWeatherData)
+        self.assertEqual(len(compact), 8)
+        self.assertEqual(compact.min_temps.typecode, "h")
+        self.assertListEqual(list(compact), self.example_three)
+        self.assertEqual(compact[4], self.example_three[4])
+        self.assertEqual(compact[-1], self.example_three[-1])
+        self.assertListEqual(compact[1:3], self.example_three[1:3])
+
+    def test_compact_functions(self):
+        compact = weather.CompactWeatherData.from_rows(self.example_three)
+        self.assertEqual(weather.generate_summary(compact), weather.generate_summary(self.example_three))
+        self.assertEqual(weather.generate_daily_summary(compact), weather.generate_daily_summary(self.example_three))
+        self.assertEqual(weather.find_min(compact.min_temps), (-52.0, 4))
+        self.assertEqual(weather.find_max(compact.max_temps), (72.0, 2))
+        self.assertEqual(weather.calculate_mean(compact.min_temps), weather.calculate_mean([row[1] for row in self.example_three]))
+
+    def test_compact_summary_ties(self):
+        rows = [
+            ["2021-07-02T07:00:00+08:00", 40, 70],
+            ["2021-07-03T07:00:00+08:00", 40, 70],
+            ["2021-07-04T07:00:00+08:00", 41, 69]
+        ]
+        accumulator = weather.CompactWeatherData.from_rows(rows).summary_accumulator()
+        self.assertEqual(accumulator.to_dict(), weather.SummaryAccumulator().update(rows).to_dict())
+
+    def test_compact_widens_columns(self):
+        compact = weather.CompactWeatherData.from_rows(self.example_three)
+        compact.append(["2020-06-27T07:00:00+08:00", 40000, 72.5])
+        self.assertEqual(compact.min_temps.typecode, "l")
+        self.assertEqual(compact.max_temps.typecode, "d")
+        self.assertEqual(compact[-1], ["2020-06-27T07:00:00+08:00", 40000, 72.5])
+        self.assertEqual(weather.generate_summary(compact), weather.generate_summary(list(compact)))
+
+    def test_compact_rejects_inexact_dates(self):
+        with self.assertRaises(ValueError):
+            weather.CompactWeatherData.from_rows([["2021-07-02T07:00:00.250+08:00", 49, 67]])
+
+    def test_compact_rejects_dates_without_seconds(self):
+        for iso_date in ["2021-07-02T07:00+08:00", "2021-07-02T07+08:00"]:
+            with self.assertRaises(ValueError):
+                weather.CompactWeatherData.from_rows([[iso_date, 49, 67]])
+            compact = weather.CompactWeatherData()
+            with self.assertRaises(ValueError):
+                compact.append([iso_date, 49, 67])
+            self.assertEqual(len(compact), 0)
+
+    def test_compact_empty(self):
+        compact = weather.CompactWeatherData()
+        self.assertEqual(weather.generate_summary(compact), weather.generate_summary([]))
+        self.assertListEqual(list(compact), [])
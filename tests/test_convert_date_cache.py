@@ -0,0 +1,53 @@
+import unittest
+import weather
+
+
+class ConvertDateCacheTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        weather.configure_date_cache()
+
+    def tearDown(self):
+        weather.configure_date_cache()
+
+    def test_convert_date_cache_hits(self):
+        date = "2021-07-05T07:00:00+08:00"
+        self.assertEqual(weather.convert_date(date), "Monday 05 July 2021")
+        self.assertEqual(weather.convert_date(date), "Monday 05 July 2021")
+        info = weather.date_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_convert_date_cache_bounded(self):
+        weather.configure_date_cache(maxsize=2)
+        for day in range(1, 6):
+            weather.convert_date(f"2021-07-0{day}T07:00:00+08:00")
+        info = weather.date_cache_info()
+        self.assertEqual((info.maxsize, info.currsize, info.misses), (2, 2, 5))
+
+    def test_convert_date_cache_clear(self):
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        weather.clear_date_cache()
+        info = weather.date_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_convert_date_cache_disabled(self):
+        weather.configure_date_cache(maxsize=0)
+        self.assertEqual(weather.convert_date("2024-02-29T07:00:00+08:00"), "Thursday 29 February 2024")
+        self.assertEqual(weather.date_cache_info().currsize, 0)
+
+    def test_convert_date_other_layouts(self):
+        self.assertEqual(weather.convert_date("2021-07-05"), "Monday 05 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-05T07:00:00-03:30"), "Monday 05 July 2021")
+        self.assertEqual(weather.convert_date("0999-12-31T07:00:00+08:00"), weather._format_date("0999-12-31T07:00:00+08:00"))
+
+    def test_convert_date_invalid(self):
+        with self.assertRaises(ValueError):
+            weather.convert_date("2021-07-05T25:00:00+08:00")
+
+    def test_generate_summary_uses_cache(self):
+        weather.generate_summary(weather.load_data_from_csv("tests/data/example_one.csv"))
+        self.assertGreater(weather.date_cache_info().misses, 0)
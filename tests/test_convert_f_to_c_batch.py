@@ -0,0 +1,41 @@
+import unittest
+import weather
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ConvertTempBatchTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_convert_f_to_c_batch(self):
+        temps_in_f = [90, -10, 64.4, "77", 90]
+        expected_result = [32.2, -23.3, 18.0, 25.0, 32.2]
+        result = weather.convert_f_to_c_batch(temps_in_f)
+        self.assertListEqual(result, expected_result)
+
+    def test_convert_f_to_c_batch_negative(self):
+        temps_in_f = [-47, -51, 58, 59, -52, 52, -48, 53]
+        expected_result = [weather.convert_f_to_c(temp) for temp in temps_in_f]
+        result = weather.convert_f_to_c_batch(temps_in_f)
+        self.assertListEqual(result, expected_result)
+
+    def test_convert_f_to_c_batch_empty(self):
+        self.assertListEqual(weather.convert_f_to_c_batch([]), [])
+
+    @unittest.skipUnless(numpy, "NumPy is not installed")
+    def test_convert_f_to_c_batch_array_matches_round(self):
+        temps_in_f = numpy.concatenate([
+            numpy.arange(-4000, 4000) * 0.05 + 32,
+            numpy.linspace(-200, 200, 100003),
+            numpy.array([31.91, 31.99, 32.09, 1e300, -1e300, 5e15]),
+        ])
+        result = weather.convert_f_to_c_batch(temps_in_f)
+        expected_result = [weather.convert_f_to_c(temp) for temp in temps_in_f.tolist()]
+        self.assertListEqual(result.tolist(), expected_result)
+        self.assertListEqual(numpy.signbit(result).tolist(), numpy.signbit(expected_result).tolist())
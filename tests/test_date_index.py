@@ -0,0 +1,43 @@
+import unittest
+import weather
+from datetime import date, datetime
+
+
+class DateIndexTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = weather.load_data_from_csv("tests/data/example_two.csv")
+
+    def test_date_index_between(self):
+        index = weather.DateIndex(self.example_two)
+        self.assertEqual(len(index), 8)
+        self.assertListEqual(index.between("2020-06-21", "2020-06-24"), self.example_two[2:5])
+        self.assertListEqual(index.between(date(2020, 6, 25)), self.example_two[6:])
+        self.assertListEqual(index.between(end=datetime(2020, 6, 20, 7)), self.example_two[:1])
+        self.assertListEqual(index.between("2021-01-01", "2021-02-01"), [])
+
+    def test_date_index_between_feeds_summaries(self):
+        index = weather.DateIndex(self.example_two)
+        result = weather.generate_summary(index.between("2020-06-01", "2020-07-01"))
+        self.assertEqual(result, weather.generate_summary(self.example_two))
+
+    def test_date_index_point_lookups(self):
+        index = weather.DateIndex(self.example_two)
+        self.assertEqual(index.get("2020-06-22T07:00:00+08:00"), self.example_two[3])
+        self.assertIsNone(index.get("2020-06-22T08:00:00+08:00"))
+        self.assertListEqual(index.on("2020-06-22"), [self.example_two[3]])
+        self.assertListEqual(index.on(date(2020, 6, 30)), [])
+
+    def test_date_index_unsorted_rows(self):
+        index = weather.DateIndex(list(reversed(self.example_two)))
+        self.assertListEqual(list(index), self.example_two)
+        self.assertListEqual(index.between("2020-06-20", "2020-06-22"), self.example_two[1:3])
+
+    def test_date_index_dates_without_seconds(self):
+        rows = [["2021-07-02T07:00+08:00", 49, 67], ["2021-07-01T07+08:00", 50, 68], ["2021-07-03T07:00:00+08:00", 51, 69]]
+        index = weather.DateIndex(rows)
+        self.assertListEqual(list(index), [rows[1], rows[0], rows[2]])
+        self.assertListEqual(index.between("2021-07-02", "2021-07-03"), [rows[0]])
+        self.assertEqual(index.get("2021-07-02T07:00:00+08:00"), rows[0])
@@ -0,0 +1,25 @@
+import unittest
+import weather
+
+
+class FormatTemperatureBatchTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_format_temperature_batch(self):
+        temps = [32.2, -23.3, 18.0, 32.2, "25", 25]
+        expected_result = ["32.2°C", "-23.3°C", "18.0°C", "32.2°C", "25°C", "25°C"]
+        self.assertListEqual(weather.format_temperature_batch(temps), expected_result)
+
+    def test_format_temperature_batch_equal_keys(self):
+        temps = [0.0, -0.0, 1.0, 1, -0.0, 0.0, 1.0]
+        expected_result = [weather.format_temperature(temp) for temp in temps]
+        self.assertListEqual(weather.format_temperature_batch(temps), expected_result)
+        self.assertEqual(expected_result[:3], ["0.0°C", "-0.0°C", "1.0°C"])
+
+    def test_format_temperature_batch_matches_daily_summary_conversion(self):
+        temps_c = weather.convert_f_to_c_batch(range(-60, 130))
+        expected_result = [weather.format_temperature(temp) for temp in temps_c]
+        self.assertListEqual(weather.format_temperature_batch(temps_c), expected_result)
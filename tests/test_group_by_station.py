@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class GroupByStationTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.one = weather.load_data_from_csv("tests/data/example_one.csv")
+        self.two = weather.load_data_from_csv("tests/data/example_two.csv")
+
+    def write(self, lines):
+        csv_file = os.path.join(self.directory, "stations.csv")
+        with open(csv_file, "w", newline="") as f:
+            f.write("\n".join(lines) + "\n")
+        return csv_file
+
+    def interleaved(self, order=("station", "date", "min", "max")):
+        rows = []
+        for index in range(max(len(self.one), len(self.two))):
+            for station, data in (("perth", self.one), ("broome", self.two)):
+                if index < len(data):
+                    values = dict(zip(("station", "date", "min", "max"), (station, *map(str, data[index]))))
+                    rows.append(",".join(values[name] for name in order))
+        return rows
+
+    def test_summarise_stations_headerless(self):
+        csv_file = self.write(self.interleaved())
+        summaries = weather.summarise_stations(csv_file)
+        self.assertEqual(list(summaries), ["perth", "broome"])
+        self.assertEqual(summaries["perth"], weather.generate_summary(self.one))
+        self.assertEqual(summaries["broome"], weather.generate_summary(self.two))
+
+    def test_summarise_stations_header_in_any_order(self):
+        order = ("max", "Date", "station", "min")
+        csv_file = self.write([",".join(order)] + self.interleaved([name.lower() for name in order]) + [""])
+        summaries = weather.summarise_stations(csv_file)
+        self.assertEqual(summaries["perth"], weather.generate_summary(self.one))
+        self.assertEqual(summaries["broome"], weather.generate_summary(self.two))
+
+    def test_group_by_station(self):
+        csv_file = self.write(["station,date,min,max"] + self.interleaved())
+        for compact in (True, False):
+            stations = weather.group_by_station(csv_file, compact=compact)
+            self.assertEqual(list(stations), ["perth", "broome"])
+            self.assertEqual(list(stations["perth"]), self.one)
+            self.assertEqual(list(stations["broome"]), self.two)
+        self.assertIsInstance(stations["perth"], list)
+        self.assertIsInstance(weather.group_by_station(csv_file)["perth"], weather.CompactWeatherData)
+
+    def test_summarise_stations_empty_file(self):
+        self.assertEqual(weather.summarise_stations(self.write(["station,date,min,max"])), {})
+
+    def test_group_by_station_dates_without_seconds(self):
+        csv_file = self.write(["station,date,min,max", "perth,2021-07-01T07:00+08:00,50,70", "broome,2021-07-01T07:00+08:00,60,80"])
+        with self.assertRaises(ValueError):
+            weather.group_by_station(csv_file)
+        stations = weather.group_by_station(csv_file, compact=False)
+        self.assertListEqual(stations["perth"], [["2021-07-01T07:00+08:00", 50, 70]])
+        self.assertEqual(weather.summarise_stations(csv_file)["broome"], weather.generate_summary(stations["broome"]))
@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class IncrementalSummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.csv_file = os.path.join(self.directory, "station.csv")
+        self.state_file = os.path.join(self.directory, "station.json")
+        with open("tests/data/example_two.csv") as csv_file:
+            self.lines = [line for line in csv_file.read().splitlines(keepends=True) if line.strip()]
+
+    def write(self, lines, mode="w"):
+        with open(self.csv_file, mode, newline="") as csv_file:
+            csv_file.writelines(lines)
+
+    def test_incremental_summary_appends(self):
+        self.write(self.lines[:4])
+        incremental = weather.IncrementalSummary(self.csv_file)
+        self.assertEqual(incremental.update(), 3)
+        self.write(self.lines[4:7], mode="a")
+        self.assertEqual(incremental.update(), 3)
+        self.assertFalse(incremental.rebuilt)
+        self.write(self.lines[7:], mode="a")
+        self.assertEqual(incremental.update(), 2)
+        self.assertEqual(incremental.update(), 0)
+        self.assertEqual(incremental.summary(), weather.generate_summary(weather.load_data_from_csv(self.csv_file)))
+
+    def test_incremental_summary_waits_for_complete_lines(self):
+        self.write(self.lines[:3] + [self.lines[3].rstrip("\n")])
+        incremental = weather.IncrementalSummary(self.csv_file)
+        self.assertEqual(incremental.update(), 2)
+        self.write(["\n"] + self.lines[4:], mode="a")
+        self.assertEqual(incremental.update(), 6)
+        self.assertEqual(incremental.summary(), weather.generate_summary(weather.load_data_from_csv(self.csv_file)))
+
+    def test_incremental_summary_rebuilds_after_truncation(self):
+        self.write(self.lines)
+        incremental = weather.IncrementalSummary(self.csv_file)
+        incremental.update()
+        self.write(self.lines[:3])
+        self.assertEqual(incremental.update(), 2)
+        self.assertTrue(incremental.rebuilt)
+        self.assertEqual(incremental.accumulator.count, 2)
+
+    def test_incremental_summary_rebuilds_after_rewrite(self):
+        self.write(self.lines[:5])
+        incremental = weather.IncrementalSummary(self.csv_file)
+        incremental.update()
+        self.write(["date,min,max\n"] + [line.replace(",5", ",4") for line in self.lines[1:]])
+        incremental.update()
+        self.assertTrue(incremental.rebuilt)
+        self.assertEqual(incremental.summary(), weather.generate_summary(weather.load_data_from_csv(self.csv_file)))
+
+    def test_incremental_summary_state_file(self):
+        self.write(self.lines[:5])
+        weather.IncrementalSummary(self.csv_file, self.state_file).update()
+        self.write(self.lines[5:], mode="a")
+        incremental = weather.IncrementalSummary(self.csv_file, self.state_file)
+        self.assertEqual(incremental.update(), 4)
+        self.assertFalse(incremental.rebuilt)
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(incremental.summary(), txt_file.read())
+
+    def test_incremental_summary_save_without_state_file(self):
+        self.write(self.lines)
+        incremental = weather.IncrementalSummary(self.csv_file)
+        incremental.update()
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        self.addCleanup(os.chdir, cwd)
+        with self.assertRaises(ValueError):
+            incremental.save()
+        self.assertListEqual(os.listdir(self.directory), ["station.csv"])
+
+    def test_incremental_summary_save_failure_leaves_no_temporary_file(self):
+        self.write(self.lines)
+        os.mkdir(self.state_file)
+        incremental = weather.IncrementalSummary(self.csv_file)
+        incremental.update()
+        with self.assertRaises(OSError):
+            incremental.save(self.state_file)
+        self.assertListEqual(sorted(os.listdir(self.directory)), ["station.csv", "station.json"])
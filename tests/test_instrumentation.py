@@ -0,0 +1,55 @@
+import json
+import unittest
+import weather
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        weather.configure_date_cache()
+
+    def tearDown(self):
+        weather.disable_instrumentation()
+
+    def test_instrumentation_counts_stages(self):
+        instrumentation = weather.enable_instrumentation()
+        data = weather.load_data_from_csv("tests/data/example_one.csv")
+        weather.generate_summary(data)
+        weather.generate_daily_summary(data)
+        report = instrumentation.report()
+        self.assertEqual(report["load_data_from_csv"]["calls"], 1)
+        self.assertEqual(report["generate_summary"]["calls"], 1)
+        self.assertEqual(report["generate_daily_summary"]["calls"], 1)
+        self.assertEqual(report["convert_date"]["calls"], 7)
+        self.assertEqual(report["format_temperature_batch"]["calls"], 2)
+        self.assertGreater(report["generate_summary"]["seconds"], 0)
+
+    def test_instrumentation_output_unchanged(self):
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        weather.enable_instrumentation(track_memory=True)
+        result = weather.generate_summary(weather.load_data_from_csv("tests/data/example_three.csv"))
+        self.assertEqual(expected_result, result)
+
+    def test_instrumentation_json_and_callback(self):
+        calls = []
+        instrumentation = weather.enable_instrumentation(callback=lambda *call: calls.append(call))
+        weather.convert_f_to_c(90)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][0], "convert_f_to_c")
+        report = json.loads(instrumentation.to_json())
+        self.assertEqual(report["convert_f_to_c"]["calls"], 1)
+
+    def test_disable_instrumentation_restores_functions(self):
+        original = weather.convert_date
+        instrumentation = weather.enable_instrumentation()
+        self.assertIsNot(weather.convert_date, original)
+        self.assertIs(weather.disable_instrumentation(), instrumentation)
+        self.assertIs(weather.convert_date, original)
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        self.assertNotIn("convert_date", instrumentation.report())
+        self.assertIsNone(weather.disable_instrumentation())
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+import weather
+
+
+class IterCSVBlocksTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def write_csv(self, text):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", newline="") as csv_file:
+            csv_file.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_fast_load_csv_file(self):
+        for name in ["example_one", "example_two", "example_three"]:
+            expected_result = weather.load_data_from_csv(f"tests/data/{name}.csv")
+            result = weather.load_data_from_csv(f"tests/data/{name}.csv", fast=True)
+            self.assertListEqual(result, expected_result)
+
+    def test_fast_load_blank_lines_and_floats(self):
+        path = self.write_csv(
+            "date,min,max\n"
+            "\n"
+            "2021-07-02T07:00:00+08:00,49.7,67.2\n"
+            "   \n"
+            ",,\n"
+            "2021-07-03T07:00:00+08:00, -3.9 ,68\n"
+            "2021-07-04T07:00:00+08:00,56,62"
+        )
+        expected_result = [
+            ["2021-07-02T07:00:00+08:00", 49, 67],
+            ["2021-07-03T07:00:00+08:00", -3, 68],
+            ["2021-07-04T07:00:00+08:00", 56, 62]
+        ]
+        self.assertListEqual(weather.load_data_from_csv(path), expected_result)
+        self.assertListEqual(weather.load_data_from_csv(path, fast=True), expected_result)
+
+    def test_fast_load_headerless_and_quoted(self):
+        path = self.write_csv(
+            "2021-07-02T07:00:00+08:00,49,67\r\n"
+            "\"2021-07-03T07:00:00+08:00\",\"57\",68\r\n"
+        )
+        self.assertListEqual(weather.load_data_from_csv(path, fast=True), weather.load_data_from_csv(path))
+
+    def test_fast_load_small_blocks(self):
+        expected_result = weather.load_data_from_csv("tests/data/example_two.csv")
+        blocks = list(weather.iter_csv_blocks("tests/data/example_two.csv", block_size=40))
+        self.assertGreater(len(blocks), 1)
+        self.assertListEqual([row for rows in blocks for row in rows], expected_result)
+
+    def test_fast_load_bad_value(self):
+        path = self.write_csv("date,min,max\n2021-07-02T07:00:00+08:00,49,67\n2021-07-03T07:00:00+08:00,cold,68\n")
+        with self.assertRaises(ValueError):
+            weather.load_data_from_csv(path, fast=True)
+
+    def test_fast_iter_csv_file(self):
+        result = list(weather.iter_data_from_csv("tests/data/example_three.csv", chunk_size=3, fast=True))
+        expected_result = list(weather.iter_data_from_csv("tests/data/example_three.csv", chunk_size=3))
+        self.assertListEqual(result, expected_result)
+
+    def test_fast_load_uneven_columns(self):
+        path = self.write_csv("2021-07-01T07:00:00+08:00,1,2,2021-07-02T07:00:00+08:00\n3,4\n")
+        with self.assertRaises(IndexError):
+            weather.load_data_from_csv(path)
+        with self.assertRaises(IndexError):
+            weather.load_data_from_csv(path, fast=True)
+
+        path = self.write_csv("2021-07-01T07:00:00+08:00,1,2,extra\n2021-07-02T07:00:00+08:00,3,4\n")
+        self.assertListEqual(weather.load_data_from_csv(path, fast=True), weather.load_data_from_csv(path))
+
+    def test_fast_load_header_only(self):
+        for text in ["date,min,max", "date,min,max\n", "date,min,max\n\n"]:
+            path = self.write_csv(text)
+            self.assertListEqual(weather.load_data_from_csv(path), [])
+            self.assertListEqual(weather.load_data_from_csv(path, fast=True), [])
@@ -0,0 +1,46 @@
+import unittest
+import weather
+
+
+class IterCSVTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_one = [
+            ["2021-07-02T07:00:00+08:00", 49, 67],
+            ["2021-07-03T07:00:00+08:00", 57, 68],
+            ["2021-07-04T07:00:00+08:00", 56, 62],
+            ["2021-07-05T07:00:00+08:00", 55, 61],
+            ["2021-07-06T07:00:00+08:00", 53, 62]
+        ]
+
+    def test_iter_csv_file(self):
+        result = weather.iter_data_from_csv("tests/data/example_one.csv")
+        self.assertNotIsInstance(result, list)
+        self.assertListEqual(list(result), self.example_one)
+
+    def test_iter_csv_file_chunks(self):
+        result = list(weather.iter_data_from_csv("tests/data/example_one.csv", chunk_size=2))
+        expected_result = [self.example_one[0:2], self.example_one[2:4], self.example_one[4:]]
+        self.assertListEqual(result, expected_result)
+
+    def test_iter_csv_file_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(weather.iter_data_from_csv("tests/data/example_one.csv", chunk_size=0))
+
+    def test_generate_summary_from_stream(self):
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_summary(weather.iter_data_from_csv("tests/data/example_three.csv"))
+        self.assertEqual(expected_result, result)
+
+    def test_generate_daily_summary_from_stream(self):
+        with open("tests/expected_output/example_two_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_daily_summary(weather.iter_data_from_csv("tests/data/example_two.csv"))
+        self.assertEqual(expected_result, result)
+
+    def test_generate_summary_from_empty_stream(self):
+        result = weather.generate_summary(iter([]))
+        self.assertTrue(result.startswith("0 Day Overview\n"))
@@ -0,0 +1,43 @@
+import unittest
+import weather
+
+
+class LazySummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def tearDown(self):
+        weather.disable_instrumentation()
+
+    def test_lazy_summary_text(self):
+        for name in ["example_one", "example_two", "example_three"]:
+            with open(f"tests/expected_output/{name}_summary.txt", encoding="utf8") as txt_file:
+                expected_result = txt_file.read()
+            summary = weather.LazySummary(weather.load_data_from_csv(f"tests/data/{name}.csv"))
+            self.assertEqual(str(summary), expected_result)
+
+    def test_lazy_summary_fields(self):
+        summary = weather.LazySummary(weather.iter_data_from_csv("tests/data/example_three.csv"))
+        self.assertEqual(summary.count, 8)
+        self.assertEqual(summary.lowest, -46.7)
+        self.assertEqual(summary.lowest_date, "Tuesday 23 June 2020")
+        self.assertEqual(summary.highest, 22.2)
+        self.assertEqual(summary.highest_date, "Sunday 21 June 2020")
+        self.assertEqual(summary.average_low, -16.1)
+        self.assertEqual(summary.average_high, 12.4)
+
+    def test_lazy_summary_computes_only_requested_fields(self):
+        summary = weather.LazySummary(weather.load_data_from_csv("tests/data/example_two.csv"))
+        instrumentation = weather.enable_instrumentation()
+        self.assertEqual(summary.highest, 22.2)
+        self.assertEqual(summary.highest, 22.2)
+        report = instrumentation.report()
+        self.assertEqual(report["convert_f_to_c"]["calls"], 1)
+        self.assertNotIn("convert_date", report)
+
+    def test_lazy_summary_empty(self):
+        summary = weather.LazySummary([])
+        self.assertEqual(str(summary), weather.generate_summary([]))
+        self.assertEqual((summary.lowest, summary.lowest_date), (0.0, ""))
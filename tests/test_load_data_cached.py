@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import weather
+
+
+class LoadCachedTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.csv_file = os.path.join(self.directory, "example_three.csv")
+        shutil.copy("tests/data/example_three.csv", self.csv_file)
+        self.cache_file = self.csv_file + weather.CACHE_SUFFIX
+
+    def test_load_cached_matches_csv(self):
+        expected_result = weather.load_data_from_csv(self.csv_file)
+        self.assertListEqual(weather.load_data_cached(self.csv_file), expected_result)
+        self.assertTrue(os.path.exists(self.cache_file))
+        self.assertListEqual(weather.load_data_cached(self.csv_file), expected_result)
+
+    def test_mapped_columns(self):
+        weather.load_data_cached(self.csv_file)
+        with weather.MappedWeatherData(self.cache_file) as cached:
+            self.assertEqual(len(cached), 8)
+            self.assertTrue(cached.is_fresh(self.csv_file))
+            self.assertEqual(cached.min_temps.format, "h")
+            self.assertListEqual(list(cached.min_temps), [-47, -51, 58, 59, -52, 52, -48, 53])
+            self.assertEqual(weather.find_min(cached.min_temps), (-52.0, 4))
+            self.assertListEqual(list(cached), weather.load_data_from_csv(self.csv_file))
+
+    def test_load_cached_rebuilds_stale_cache(self):
+        weather.load_data_cached(self.csv_file)
+        with open(self.csv_file, "a") as csv_file:
+            csv_file.write("2020-06-27T07:00:00+08:00,-60,70\n")
+        result = weather.load_data_cached(self.csv_file)
+        self.assertEqual(result[-1], ["2020-06-27T07:00:00+08:00", -60, 70])
+        with weather.MappedWeatherData(self.cache_file) as cached:
+            self.assertEqual(len(cached), 9)
+            self.assertTrue(cached.is_fresh(self.csv_file))
+
+    def test_load_cached_ignores_corrupt_cache(self):
+        with open(self.cache_file, "wb") as cache_file:
+            cache_file.write(b"not a cache")
+        self.assertListEqual(weather.load_data_cached(self.csv_file), weather.load_data_from_csv(self.csv_file))
+
+    def test_write_cache_rejects_unrepresentable_rows(self):
+        rows = [["2021-07-02T07:00:00.5+08:00", 49, 67]]
+        self.assertFalse(weather.write_data_cache(rows, self.cache_file, self.csv_file))
+        rows = [["2021-07-02T07:00:00+08:00", 49, 70000]]
+        self.assertFalse(weather.write_data_cache(rows, self.cache_file, self.csv_file))
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_encode_dates_without_seconds(self):
+        iso_dates = ["2021-07-02T07:00+08:00", "2021-07-02T07+08:00", "2021-07-02T07:00:00+08:00", "2021-07-02T07:30"]
+        dates, offsets = weather._encode_iso_dates(iso_dates)
+        expected_result = [weather._encode_iso_date(iso_date) for iso_date in iso_dates]
+        self.assertListEqual(list(zip(dates, offsets)), expected_result)
+
+        # These dates can't be stored exactly, so they are left to the csv file
+        rows = [["2021-07-02T07:00+08:00", 49, 67]]
+        self.assertFalse(weather.write_data_cache(rows, self.cache_file, self.csv_file))
+        with open(self.csv_file, "w") as csv_file:
+            csv_file.write("date,min,max\n2021-07-02T07:00+08:00,49,67\n")
+        self.assertListEqual(weather.load_data_cached(self.csv_file), rows)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_write_cache_empty(self):
+        self.assertTrue(weather.write_data_cache([], self.cache_file, self.csv_file))
+        with weather.MappedWeatherData(self.cache_file) as cached:
+            self.assertListEqual(cached.rows(), [])
+
+    def test_load_cached_unwritable_cache(self):
+        expected_result = weather.load_data_from_csv(self.csv_file)
+        missing_directory_cache = os.path.join(self.directory, "missing", "weather.wcache")
+        self.assertListEqual(weather.load_data_cached(self.csv_file, missing_directory_cache), expected_result)
+
+        # A directory can't be replaced by the cache file, so the write fails after the temporary file exists
+        os.mkdir(self.cache_file)
+        self.assertListEqual(weather.load_data_cached(self.csv_file), expected_result)
+        self.assertListEqual(sorted(os.listdir(self.directory)), ["example_three.csv", "example_three.csv.wcache"])
+
+    def test_load_cached_file_changed_while_parsing(self):
+        load_data_from_csv = weather.load_data_from_csv
+
+        def load_then_append(*args, **kwargs):
+            data = load_data_from_csv(*args, **kwargs)
+            with open(self.csv_file, "a") as csv_file:
+                csv_file.write("2020-06-27T07:00:00+08:00,-60,70\n")
+            return data
+
+        with mock.patch.object(weather, "load_data_from_csv", side_effect=load_then_append):
+            self.assertEqual(len(weather.load_data_cached(self.csv_file)), 8)
+        with weather.MappedWeatherData(self.cache_file) as cached:
+            self.assertFalse(cached.is_fresh(self.csv_file))
+        self.assertEqual(len(weather.load_data_cached(self.csv_file)), 9)
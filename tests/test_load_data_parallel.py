@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class LoadDataParallelTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write(self, text, name="weather.csv"):
+        csv_file = os.path.join(self.directory, name)
+        with open(csv_file, "w", newline="") as f:
+            f.write(text)
+        return csv_file
+
+    def test_load_data_parallel_matches_load_data_from_csv(self):
+        for name in ("example_one", "example_two", "example_three"):
+            csv_file = f"tests/data/{name}.csv"
+            expected_result = weather.load_data_from_csv(csv_file)
+            for max_workers in (1, 2):
+                result = weather.load_data_parallel(csv_file, max_workers=max_workers, chunk_size=16)
+                self.assertListEqual(result, expected_result)
+
+    def test_load_data_parallel_header_only_in_first_chunk(self):
+        lines = [f"2021-07-{day:02d}T07:00:00+08:00,{day},{day + 20}" for day in range(1, 29)]
+        lines.insert(14, "date,min,max")
+        csv_file = self.write("date,min,max\r\n" + "\r\n".join(lines[:14]) + "\r\n\r\n" + "\n".join(lines[14:]))
+        with self.assertRaises(ValueError):
+            weather.load_data_from_csv(csv_file)
+        with self.assertRaises(ValueError):
+            weather.load_data_parallel(csv_file, max_workers=2, chunk_size=64)
+
+        del lines[14]
+        csv_file = self.write("date,min,max\r\n" + "\r\n".join(lines[:14]) + "\r\n\r\n" + "\n".join(lines[14:]))
+        expected_result = weather.load_data_from_csv(csv_file)
+        self.assertEqual(len(expected_result), 28)
+        for chunk_size in (1, 40, 64, 1000):
+            result = weather.load_data_parallel(csv_file, max_workers=3, chunk_size=chunk_size)
+            self.assertListEqual(result, expected_result)
+
+    def test_load_data_parallel_headerless_and_empty(self):
+        csv_file = self.write("2021-07-01T07:00:00+08:00,50,70\n2021-07-02T07:00:00+08:00,51,71")
+        self.assertListEqual(weather.load_data_parallel(csv_file, max_workers=2, chunk_size=1), weather.load_data_from_csv(csv_file))
+        self.assertListEqual(weather.load_data_parallel(self.write("", "empty.csv"), max_workers=2), [])
+        self.assertListEqual(weather.load_data_parallel(self.write("date,min,max\n", "header.csv"), max_workers=2), [])
+
+    def test_split_csv_file_cuts_on_newlines(self):
+        csv_file = self.write("a\nbb\nccc\ndddd\n")
+        ranges = weather._split_csv_file(csv_file, 10)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(csv_file))
+        with open(csv_file, "rb") as f:
+            data = f.read()
+        for start, end in ranges:
+            self.assertTrue(start == 0 or data[start - 1:start] == b"\n")
+        self.assertEqual([end for _, end in ranges[:-1]], [start for start, _ in ranges[1:]])
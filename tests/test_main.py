@@ -0,0 +1,84 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from contextlib import redirect_stderr, redirect_stdout
+import weather
+
+
+class MainTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = weather.main(list(argv))
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_main_summary(self):
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        self.assertEqual(self.run_main("summary", "tests/data/example_one.csv"), (0, expected_result, ""))
+
+    def test_main_daily(self):
+        with open("tests/expected_output/example_two_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        self.assertEqual(self.run_main("daily", "tests/data/example_two.csv"), (0, expected_result, ""))
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        output_file = os.path.join(directory, "daily.txt")
+        self.assertEqual(self.run_main("daily", "tests/data/example_two.csv", "-o", output_file), (0, "", ""))
+        with open(output_file, encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), expected_result)
+
+    def test_main_batch(self):
+        status, stdout, stderr = self.run_main("batch", "tests/data/example_t*.csv", "missing.csv", "-j", "1")
+        self.assertEqual(status, 1)
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            self.assertIn(f"==== tests/data/example_three.csv ====\n{txt_file.read()}\n", stdout)
+        self.assertLess(stdout.index("example_three.csv"), stdout.index("example_two.csv"))
+        self.assertIn("missing.csv: FileNotFoundError", stderr)
+
+    def test_main_batch_rejects_bad_workers(self):
+        for workers in ("0", "-2", "many"):
+            with self.assertRaises(SystemExit) as raised:
+                self.run_main("batch", "tests/data/example_one.csv", "-j", workers)
+            self.assertEqual(raised.exception.code, 2)
+
+    def test_main_batch_failure(self):
+        with mock.patch.object(weather, "summarise_files", side_effect=OSError("no processes left")):
+            status, stdout, stderr = self.run_main("batch", "tests/data/example_one.csv")
+        self.assertEqual((status, stdout), (1, ""))
+        self.assertEqual(stderr, "batch: OSError: no processes left\n")
+
+    def test_main_missing_file(self):
+        status, stdout, stderr = self.run_main("summary", "missing.csv")
+        self.assertEqual((status, stdout), (1, ""))
+        self.assertIn("missing.csv: FileNotFoundError", stderr)
+
+    def test_main_validate(self):
+        status, stdout, stderr = self.run_main("validate", "tests/data/example_three.csv")
+        self.assertEqual((status, stderr), (0, ""))
+        self.assertIn(": 8 valid, 0 invalid\n", stdout)
+
+    def test_import_is_lightweight(self):
+        heavy_modules = ["numpy", "pyarrow", "asyncio", "concurrent.futures", "multiprocessing", "json", "hashlib", "tracemalloc", "argparse"]
+        code = f"import sys, weather; print([name for name in {heavy_modules!r} if name in sys.modules])"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_python_m_weather(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "weather", "summary", "tests/data/example_one.csv"],
+            capture_output=True, check=True, env={**os.environ, "PYTHONIOENCODING": "utf8"},
+        )
+        with open("tests/expected_output/example_one_summary.txt", "rb") as txt_file:
+            self.assertEqual(result.stdout.replace(b"\r\n", b"\n"), txt_file.read().replace(b"\r\n", b"\n"))
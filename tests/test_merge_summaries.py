@@ -0,0 +1,63 @@
+import json
+import random
+import unittest
+import weather
+
+
+class MergeSummariesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_three = [
+            ["2020-06-19T07:00:00+08:00", -47, -46],
+            ["2020-06-20T07:00:00+08:00", -51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", -52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", -48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def partials(self, boundaries):
+        shards = [self.example_three[start:end] for start, end in zip([0] + boundaries, boundaries + [None])]
+        return [weather.SummaryAccumulator().update(shard) for shard in shards]
+
+    def test_merge_matches_generate_summary(self):
+        expected_result = weather.generate_summary(self.example_three)
+        for boundaries in ([3], [1, 4], [2, 2, 6], [0, 8]):
+            merged = weather.merge_summaries(self.partials(boundaries))
+            self.assertEqual(merged.summary(), expected_result)
+
+    def test_merge_is_associative(self):
+        first, second, third = self.partials([3, 5])
+        left = first.merge(second).merge(third)
+        right = first.merge(second.merge(third))
+        self.assertEqual(left.to_dict(), right.to_dict())
+
+    def test_merge_ties_across_shards(self):
+        rows = [["2021-07-02T07:00:00+08:00", 40, 70], ["2021-07-03T07:00:00+08:00", 40, 70]]
+        merged = weather.SummaryAccumulator().update(rows[:1]).merge(weather.SummaryAccumulator().update(rows[1:]))
+        self.assertEqual((merged.min_index, merged.min_date), (1, "2021-07-03T07:00:00+08:00"))
+        self.assertEqual((merged.max_index, merged.max_date), (1, "2021-07-03T07:00:00+08:00"))
+
+    def test_merge_serialized_partials(self):
+        states = [json.loads(json.dumps(partial.to_dict())) for partial in self.partials([4])]
+        merged = weather.merge_summaries(states)
+        self.assertEqual(merged.to_dict(), weather.SummaryAccumulator().update(self.example_three).to_dict())
+
+    def test_merge_empty(self):
+        self.assertEqual(weather.merge_summaries([]).summary(), weather.generate_summary([]))
+
+    def test_merge_whole_numbers_match_generate_summary(self):
+        generator = random.Random(0)
+        for _ in range(200):
+            rows = [
+                [f"2021-07-{day:02d}T07:00:00+08:00", generator.randint(-60, 90), generator.randint(-60, 120)]
+                for day in range(1, generator.randint(2, 29))
+            ]
+            boundaries = sorted(generator.sample(range(len(rows) + 1), 2))
+            shards = [rows[:boundaries[0]], rows[boundaries[0]:boundaries[1]], rows[boundaries[1]:]]
+            merged = weather.merge_summaries(weather.SummaryAccumulator().update(shard) for shard in shards)
+            self.assertEqual(merged.summary(), weather.generate_summary(rows))
@@ -0,0 +1,42 @@
+import random
+import unittest
+import weather
+
+
+class RollingSummariesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_rolling_summaries_match_generate_summary(self):
+        data = weather.load_data_from_csv("tests/data/example_three.csv")
+        for window in (1, 3, 7, 8):
+            windows = list(weather.rolling_summaries(data, window))
+            self.assertEqual(len(windows), len(data) - window + 1)
+            for result in windows:
+                expected_result = weather.generate_summary(data[result.start:result.start + window])
+                self.assertEqual(result.summary(), expected_result)
+
+    def test_rolling_summaries_random_ties(self):
+        generator = random.Random(7)
+        data = [
+            [f"2021-{month:02d}-{day:02d}T07:00:00+08:00", generator.randint(40, 44), generator.randint(60, 63)]
+            for month in range(1, 13) for day in range(1, 29)
+        ]
+        for result in weather.rolling_summaries(data, 30):
+            part = data[result.start:result.start + 30]
+            min_temp, min_index = weather.find_min([row[1] for row in part])
+            max_temp, max_index = weather.find_max([row[2] for row in part])
+            self.assertEqual((result.min_temp, result.min_date), (min_temp, part[min_index][0]))
+            self.assertEqual((result.max_temp, result.max_date), (max_temp, part[max_index][0]))
+            self.assertEqual(result.min_mean, weather.calculate_mean([row[1] for row in part]))
+            self.assertEqual(result.summary(), weather.generate_summary(part))
+
+    def test_rolling_summaries_short_data(self):
+        data = weather.load_data_from_csv("tests/data/example_one.csv")
+        self.assertListEqual(list(weather.rolling_summaries(data, 30)), [])
+
+    def test_rolling_summaries_bad_window(self):
+        with self.assertRaises(ValueError):
+            list(weather.rolling_summaries([], 0))
@@ -0,0 +1,37 @@
+import unittest
+import weather
+
+
+class SummariseFilesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.names = ["example_one", "example_three", "example_two"]
+
+    def expected_summary(self, name):
+        with open(f"tests/expected_output/{name}_summary.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_summarise_files_glob(self):
+        results = weather.summarise_files("tests/data/example_*.csv", max_workers=2)
+        self.assertListEqual([result.path for result in results], [f"tests/data/{name}.csv" for name in self.names])
+        for name, result in zip(self.names, results):
+            self.assertEqual(result.summary, self.expected_summary(name))
+            self.assertIsNone(result.error)
+
+    def test_summarise_files_keeps_order(self):
+        paths = [f"tests/data/{name}.csv" for name in reversed(self.names)]
+        results = weather.summarise_files(paths, max_workers=1)
+        self.assertListEqual([result.path for result in results], paths)
+
+    def test_summarise_files_reports_errors(self):
+        paths = ["tests/data/example_one.csv", "tests/data/missing.csv", "tests/data/example_two.csv"]
+        results = weather.summarise_files(paths, max_workers=2)
+        self.assertEqual(results[0].summary, self.expected_summary("example_one"))
+        self.assertIsNone(results[1].summary)
+        self.assertTrue(results[1].error.startswith("FileNotFoundError"))
+        self.assertEqual(results[2].summary, self.expected_summary("example_two"))
+
+    def test_summarise_files_empty(self):
+        self.assertListEqual(weather.summarise_files([]), [])
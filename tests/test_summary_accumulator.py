@@ -0,0 +1,44 @@
+import unittest
+import weather
+
+
+class SummaryAccumulatorTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = [
+            ["2020-06-19T07:00:00+08:00", 47, 46],
+            ["2020-06-20T07:00:00+08:00", 51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", 52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", 48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def test_accumulator_example_two(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        accumulator = weather.SummaryAccumulator()
+        for row in self.example_two:
+            accumulator.add(row)
+        self.assertEqual(expected_result, accumulator.summary())
+        self.assertEqual(expected_result, str(accumulator))
+
+    def test_accumulator_last_index_ties(self):
+        accumulator = weather.SummaryAccumulator().update(self.example_two)
+        self.assertEqual(accumulator.count, 8)
+        self.assertEqual((accumulator.min_temp, accumulator.min_index), (47.0, 0))
+        self.assertEqual((accumulator.max_temp, accumulator.max_index), weather.find_max([row[2] for row in self.example_two]))
+        self.assertEqual(accumulator.max_date, "2020-06-21T07:00:00+08:00")
+
+    def test_accumulator_means(self):
+        accumulator = weather.SummaryAccumulator().update(self.example_two)
+        self.assertEqual(accumulator.min_mean, weather.calculate_mean([row[1] for row in self.example_two]))
+        self.assertEqual(accumulator.max_mean, weather.calculate_mean([row[2] for row in self.example_two]))
+
+    def test_accumulator_empty(self):
+        accumulator = weather.SummaryAccumulator()
+        self.assertEqual(accumulator.summary(), weather.generate_summary([]))
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class SummaryCacheTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = weather.load_data_from_csv("tests/data/example_two.csv")
+
+    def test_summary_cache_hits(self):
+        cache = weather.SummaryCache()
+        expected_result = weather.generate_summary(self.example_two)
+        self.assertEqual(cache.summary(self.example_two), expected_result)
+        self.assertEqual(cache.summary([list(row) for row in self.example_two]), expected_result)
+        info = cache.info()["summary"]
+        self.assertEqual((info.hits, info.misses, info.hit_rate), (1, 1, 0.5))
+
+    def test_summary_cache_content_changes(self):
+        cache = weather.SummaryCache()
+        cache.summary(self.example_two)
+        changed = [row[:] for row in self.example_two]
+        changed[0][1] = 10
+        self.assertEqual(cache.summary(changed), weather.generate_summary(changed))
+        self.assertEqual(cache.info()["summary"].misses, 2)
+
+    def test_summary_cache_evicts_least_recently_used(self):
+        cache = weather.SummaryCache(maxsize=2)
+        first, second, third = self.example_two[:2], self.example_two[2:4], self.example_two[4:]
+        cache.summary(first)
+        cache.summary(second)
+        cache.summary(first)
+        cache.summary(third)
+        self.assertEqual(cache.info()["summary"].currsize, 2)
+        cache.summary(first)
+        cache.summary(second)
+        self.assertEqual(cache.info()["summary"].hits, 2)
+
+    def test_summary_cache_for_file(self):
+        cache = weather.SummaryCache()
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        self.assertEqual(cache.summary_for_file("tests/data/example_one.csv"), expected_result)
+        self.assertEqual(cache.summary_for_file("tests/data/example_one.csv"), expected_result)
+        self.assertEqual(cache.info()["summary"].hits, 1)
+
+    def test_daily_summary_cache_reuses_days(self):
+        cache = weather.SummaryCache()
+        self.assertEqual(cache.daily_summary(self.example_two[:5]), weather.generate_daily_summary(self.example_two[:5]))
+        self.assertEqual(cache.daily_summary(self.example_two[3:]), weather.generate_daily_summary(self.example_two[3:]))
+        info = cache.info()["daily"]
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 8, 8))
+
+    def test_summary_cache_persistence(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "summaries.json")
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.remove, path)
+        cache = weather.SummaryCache(path=path)
+        cache.summary(self.example_two)
+        cache.daily_summary(self.example_two)
+        cache.save()
+        reloaded = weather.SummaryCache(path=path)
+        self.assertEqual(reloaded.summary(self.example_two), weather.generate_summary(self.example_two))
+        self.assertEqual(reloaded.daily_summary(self.example_two), weather.generate_daily_summary(self.example_two))
+        self.assertEqual(reloaded.info()["summary"].hits, 1)
+        self.assertEqual(reloaded.info()["daily"].misses, 0)
+
+    def test_summary_cache_save_without_path(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        cwd = os.getcwd()
+        os.chdir(directory)
+        self.addCleanup(os.chdir, cwd)
+        with self.assertRaises(ValueError):
+            weather.SummaryCache().save()
+        self.assertListEqual(os.listdir(directory), [])
+
+    def test_summary_cache_save_failure_leaves_no_temporary_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "summaries.json")
+        os.mkdir(path)
+        with self.assertRaises(OSError):
+            weather.SummaryCache(path=path).save()
+        self.assertListEqual(os.listdir(directory), ["summaries.json"])
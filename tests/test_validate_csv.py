@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class ValidateCsvTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.csv_file = os.path.join(self.directory, "weather.csv")
+        with open(self.csv_file, "w", newline="") as f:
+            f.write(
+                "date,min,max\n"
+                "2021-07-01T07:00:00+08:00,50,70\n"
+                "\n"
+                "2021-13-01T07:00:00+08:00,50,70\n"
+                "2021-07-03T07:00:00+08:00,abc,70\n"
+                "2021-07-04T07:00:00+08:00,50,700\n"
+                "2021-07-05T07:00:00+08:00,50\n"
+                '"2021-07-06T07:00:00+08:00",51.7,"72"\n'
+                "2021-07-07T07:00:00+08:00,-200,60"
+            )
+
+    def test_validate_csv_valid_files(self):
+        for name in ("example_one", "example_two", "example_three"):
+            csv_file = f"tests/data/{name}.csv"
+            report = weather.validate_csv(csv_file)
+            self.assertListEqual(report.rows, weather.load_data_from_csv(csv_file))
+            self.assertEqual((report.errors, report.error_count), ([], 0))
+
+    def test_validate_csv_collects_bad_rows(self):
+        expected_errors = [
+            (4, "invalid date '2021-13-01T07:00:00+08:00'"),
+            (5, "min is not a number: 'abc'"),
+            (6, "max temperature 700 is outside -130 to 140"),
+            (7, "expected 3 columns, found 2"),
+            (9, "min temperature -200 is outside -130 to 140"),
+        ]
+        expected_rows = [["2021-07-01T07:00:00+08:00", 50, 70], ["2021-07-06T07:00:00+08:00", 51, 72]]
+        for block_size in (1, 7, 40, weather.CSV_BLOCK_SIZE):
+            report = weather.validate_csv(self.csv_file, block_size=block_size)
+            self.assertEqual([(error.line, error.message) for error in report.errors], expected_errors)
+            self.assertListEqual(report.rows, expected_rows)
+            self.assertEqual(report.error_count, 5)
+        self.assertEqual(report.errors[1].text, "2021-07-03T07:00:00+08:00,abc,70")
+
+    def test_validate_csv_temperature_range_and_error_limit(self):
+        report = weather.validate_csv(self.csv_file, temperature_range=(-300, 1000), max_errors=1)
+        self.assertEqual(len(report.rows), 4)
+        self.assertEqual(report.error_count, 3)
+        self.assertEqual(len(report.errors), 1)
+        self.assertIn("... and 2 more", str(report))
+
+    def test_validate_csv_report(self):
+        report = weather.validate_csv(self.csv_file)
+        self.assertGreater(report.seconds, 0)
+        self.assertGreater(report.rows_per_second, 0)
+        text = str(report)
+        self.assertTrue(text.startswith("7 rows checked in "))
+        self.assertIn(": 2 valid, 5 invalid\n", text)
+        self.assertIn("  line 5: min is not a number: 'abc': 2021-07-03T07:00:00+08:00,abc,70\n", text)
+
+    def test_validate_csv_infinite_and_nan(self):
+        with open(self.csv_file, "w", newline="") as f:
+            f.write("2021-07-01T07:00:00+08:00,inf,70\n2021-07-02T07:00:00+08:00,50,nan\n2021-07-03T07:00:00+08:00,50,70\n")
+        report = weather.validate_csv(self.csv_file)
+        self.assertEqual(
+            [(error.line, error.message) for error in report.errors],
+            [(1, "min is not a number: 'inf'"), (2, "max is not a number: 'nan'")],
+        )
+        self.assertListEqual(report.rows, [["2021-07-03T07:00:00+08:00", 50, 70]])
+
+    def test_validate_csv_uneven_columns(self):
+        with open(self.csv_file, "w", newline="") as f:
+            f.write("2021-07-01,1,2,2021-07-02\n3,4\n")
+        report = weather.validate_csv(self.csv_file)
+        self.assertEqual(
+            [(error.line, error.message) for error in report.errors],
+            [(1, "expected 3 columns, found 4"), (2, "expected 3 columns, found 2")],
+        )
+        self.assertListEqual(report.rows, [])
@@ -0,0 +1,103 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+import weather
+import weather_service
+
+
+class WeatherServiceTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def request(self, service, target, method="GET"):
+        async def run():
+            server = await weather_service.serve("127.0.0.1", 0, service)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("ascii"))
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+                return response
+        head, _, body = asyncio.run(run()).partition(b"\r\n\r\n")
+        return int(head.split(b" ")[1]), body.decode("utf8")
+
+    def test_service_summary(self):
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        service = weather_service.WeatherService(root="tests/data")
+        status, body = self.request(service, "/summary?path=example_one.csv")
+        self.assertEqual(status, 200)
+        self.assertEqual(body, expected_result)
+
+    def test_service_daily_summary_range(self):
+        data = weather.load_data_from_csv("tests/data/example_two.csv")
+        service = weather_service.WeatherService(root="tests/data")
+        status, body = self.request(service, "/daily?path=example_two.csv&start=2020-06-21&end=2020-06-23")
+        self.assertEqual(status, 200)
+        self.assertEqual(body, weather.generate_daily_summary(data[2:4]))
+
+    def test_service_errors(self):
+        service = weather_service.WeatherService(root="tests/data")
+        self.assertEqual(self.request(service, "/summary")[0], 400)
+        self.assertEqual(self.request(service, "/summary?path=missing.csv")[0], 404)
+        self.assertEqual(self.request(service, "/summary?path=../../weather.py")[0], 403)
+        self.assertEqual(self.request(service, "/other?path=example_one.csv")[0], 404)
+        self.assertEqual(self.request(service, "/summary?path=example_one.csv", method="POST")[0], 405)
+        self.assertEqual(self.request(service, "/summary?path=example_one.csv&start=soon")[0], 400)
+
+    def test_service_coalesces_loads(self):
+        service = weather_service.WeatherService()
+        path = service.resolve("tests/data/example_three.csv")
+
+        async def run():
+            return await asyncio.gather(*[service.summary(path) for _ in range(10)])
+
+        results = asyncio.run(run())
+        self.assertEqual(service.loads, 1)
+        self.assertEqual(set(results), {weather.generate_summary(weather.load_data_from_csv(path))})
+        asyncio.run(service.summary(path))
+        self.assertEqual(service.loads, 1)
+
+    def test_service_defaults_to_current_directory(self):
+        service = weather_service.WeatherService()
+        self.assertEqual(service.root, str(Path.cwd().resolve()))
+        self.assertEqual(self.request(service, "/summary?path=/etc/passwd")[0], 403)
+
+    def test_service_hides_file_contents_in_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "secret.txt").write_text("secret_token_abc,1,2\n")
+            service = weather_service.WeatherService(root=directory)
+            status, body = self.request(service, "/summary?path=secret.txt")
+        self.assertEqual(status, 400)
+        self.assertEqual(body, "the csv file could not be parsed\n")
+        self.assertNotIn("secret_token_abc", body)
+
+    def test_service_bad_date_range(self):
+        service = weather_service.WeatherService(root="tests/data")
+        self.assertEqual(self.request(service, "/summary?path=example_one.csv&end=later"), (400, "end must be an ISO date\n"))
+
+    def test_service_evicts_least_recently_used_datasets(self):
+        service = weather_service.WeatherService(root="tests/data", max_datasets=2)
+        paths = [service.resolve(f"example_{name}.csv") for name in ("one", "two", "one", "three")]
+
+        async def run():
+            for path in paths:
+                await service.summary(path)
+
+        asyncio.run(run())
+        self.assertEqual(list(service.datasets), [paths[0], paths[3]])
+        self.assertEqual(service.loads, 3)
+
+    def test_service_dates_without_seconds(self):
+        rows = [["2021-07-01T07:00+08:00", 49, 67], ["2021-07-02T07:00+08:00", 50, 68]]
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "station.csv").write_text("date,min,max\n" + "".join(f"{d},{a},{b}\n" for d, a, b in rows))
+            service = weather_service.WeatherService(root=directory)
+            status, body = self.request(service, "/summary?path=station.csv&start=2021-07-02")
+        self.assertEqual((status, body), (200, weather.generate_summary(rows[1:])))
@@ -0,0 +1,64 @@
+import unittest
+import weather
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy, "NumPy is not installed")
+class WeatherTableTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_load_csv_as_table(self):
+        for name in ["example_one", "example_two", "example_three"]:
+            rows = weather.load_data_from_csv(f"tests/data/{name}.csv")
+            table = weather.load_data_from_csv(f"tests/data/{name}.csv", as_table=True)
+            self.assertIsInstance(table, weather.WeatherTable)
+            self.assertEqual(len(table), len(rows))
+            self.assertEqual(table.dates.dtype, numpy.dtype("datetime64[s]"))
+            self.assertEqual(table.min_temps.dtype, numpy.float32)
+            self.assertListEqual(list(table), rows)
+
+    def test_table_find_min_max(self):
+        rows = weather.load_data_from_csv("tests/data/example_three.csv")
+        table = weather.WeatherTable.from_rows(rows)
+        self.assertEqual(weather.find_min(table.min_temps), weather.find_min([row[1] for row in rows]))
+        self.assertEqual(weather.find_max(table.max_temps), weather.find_max([row[2] for row in rows]))
+
+    def test_table_find_repeated_value(self):
+        temperatures = numpy.array([49, 57, 56, 55, 57, 53, 49], dtype=numpy.float32)
+        self.assertEqual(weather.find_max(temperatures), (57.0, 4))
+        self.assertEqual(weather.find_min(temperatures), (49.0, 6))
+
+    def test_table_empty_column(self):
+        empty = numpy.array([], dtype=numpy.float32)
+        self.assertEqual(weather.find_min(empty), ())
+        self.assertEqual(weather.find_max(empty), ())
+        self.assertEqual(weather.calculate_mean(empty), 0)
+
+    def test_table_calculate_mean(self):
+        temperatures = [51.0, 58.2, 59.9, 52.4, 52.1, 48.4, 47.8, 53.43]
+        result = weather.calculate_mean(numpy.array(temperatures))
+        self.assertEqual(result, weather.calculate_mean(temperatures))
+
+    def test_table_convert_f_to_c(self):
+        rows = weather.load_data_from_csv("tests/data/example_three.csv")
+        table = weather.WeatherTable.from_rows(rows)
+        expected_result = [weather.convert_f_to_c(row[1]) for row in rows]
+        self.assertListEqual(weather.convert_f_to_c(table.min_temps).tolist(), expected_result)
+
+    def test_table_generate_summary(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        table = weather.load_data_from_csv("tests/data/example_two.csv", as_table=True)
+        self.assertEqual(expected_result, weather.generate_summary(table))
+
+    def test_table_normalises_other_data(self):
+        rows = [["2021-07-05", 50.3, 70], ["2021-07-06 07:00:00", 51, 71.5]]
+        expected_result = [["2021-07-05T00:00:00", 50.29999923706055, 70], ["2021-07-06T07:00:00", 51, 71.5]]
+        self.assertListEqual(list(weather.WeatherTable.from_rows(rows)), expected_result)
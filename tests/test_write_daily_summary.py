@@ -0,0 +1,34 @@
+import io
+import unittest
+import weather
+
+
+class WriteDailySummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_write_daily_summary(self):
+        for name in ["example_one", "example_two", "example_three"]:
+            with open(f"tests/expected_output/{name}_daily_summary.txt", encoding="utf8") as txt_file:
+                expected_result = txt_file.read()
+            output = io.StringIO()
+            days = weather.write_daily_summary(weather.iter_data_from_csv(f"tests/data/{name}.csv"), output)
+            self.assertEqual(expected_result, output.getvalue())
+            self.assertEqual(days, expected_result.count("----") // 2)
+
+    def test_iter_daily_summary_blocks(self):
+        blocks = list(weather.iter_daily_summary(weather.load_data_from_csv("tests/data/example_one.csv")))
+        self.assertEqual(len(blocks), 5)
+        self.assertEqual(
+            blocks[0],
+            "---- Friday 02 July 2021 ----\n"
+            "  Minimum Temperature: 9.4°C\n"
+            "  Maximum Temperature: 19.4°C\n\n"
+        )
+
+    def test_write_daily_summary_empty(self):
+        output = io.StringIO()
+        self.assertEqual(weather.write_daily_summary([], output), 0)
+        self.assertEqual(output.getvalue(), "")
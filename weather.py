@@ -1,8 +1,28 @@
 import csv
-from datetime import datetime
+import glob
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache, wraps
+from itertools import chain, islice, repeat
+from typing import NamedTuple
 
 DEGREE_SYMBOL = u"\N{DEGREE SIGN}C"
 
+# Default number of formatted dates kept by convert_date
+DATE_CACHE_SIZE = 4096
+
+# Number of characters iter_csv_blocks reads at a time
+CSV_BLOCK_SIZE = 1 << 20
+
+# Number of rows iter_daily_summary converts in one batch
+_DAILY_CHUNK_SIZE = 4096
+
 def format_temperature(temp):
     """Takes a temperature and returns it in string format with the degrees
         and Celcius symbols.
@@ -14,6 +34,40 @@ def format_temperature(temp):
     """
     return f"{temp}{DEGREE_SYMBOL}"
 
+# Formatted strings for the temperatures format_temperature_batch has seen
+_TEMPERATURE_STRINGS = {}
+
+# Most strings _TEMPERATURE_STRINGS keeps, so unusual data can't grow it forever
+_TEMPERATURE_STRINGS_LIMIT = 65536
+
+def format_temperature_batch(temps):
+    """Formats a whole column of temperatures like format_temperature.
+
+    Converted temperatures are rounded to 0.1°C, so real data only has a few
+    hundred distinct values; each one is formatted once and the string reused.
+
+    Args:
+        temps: A sequence of temperatures, e.g. from convert_f_to_c_batch.
+    Returns:
+        A list of strings, each identical to format_temperature for that value.
+    """
+
+    strings = _TEMPERATURE_STRINGS
+    results = []
+    for temp in temps:
+        # Only non-zero floats are reused: 1 == 1.0 and 0.0 == -0.0 as dict
+        # keys, but they are formatted differently
+        if type(temp) is float and temp:
+            text = strings.get(temp)
+            if text is None:
+                text = f"{temp}{DEGREE_SYMBOL}"
+                if len(strings) < _TEMPERATURE_STRINGS_LIMIT:
+                    strings[temp] = text
+        else:
+            text = format_temperature(temp)
+        results.append(text)
+    return results
+
 #-------------------------------------------------------------------#
 #                          Question One:                            #
 #-------------------------------------------------------------------#
@@ -25,6 +79,21 @@ def format_temperature(temp):
 def convert_date(iso_string):
     """Converts and ISO formatted date into a human-readable format.
 
+    Results are kept in a bounded LRU cache, see configure_date_cache and
+    date_cache_info.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        A date formatted like: Weekday Date Month Year e.g. Tuesday 06 July 2021
+    """
+
+    # Look the date up in the cache, formatting it only on a miss
+    return _cached_format_date(iso_string)
+
+def _format_date(iso_string):
+    """Formats an ISO date string without using the cache.
+
     Args:
         iso_string: An ISO date string.
     Returns:
@@ -34,11 +103,87 @@ def convert_date(iso_string):
     # Use datetime.fromisoformat to convert the string to a date object
     convert_the_date_type = datetime.fromisoformat(iso_string)
 
+    # Fast path: for the common "YYYY-MM-DDTHH:MM:SS+HH:MM" layout, build the
+    # text from lookup tables rather than calling the much slower strftime
+    if _is_fixed_offset_iso(iso_string) and convert_the_date_type.year >= 1000:
+        day_names, month_names = _date_names()
+        return " ".join((
+            day_names[convert_the_date_type.weekday()],
+            _DAY_NUMBERS[convert_the_date_type.day],
+            month_names[convert_the_date_type.month - 1],
+            str(convert_the_date_type.year),
+        ))
+
     # Use strftime to format the string into "Weekday(%A) Day(%d) Month(%B) Year(%Y)"
-    formatted_date = convert_the_date_type.strftime("%A %d %B %Y")
+    return convert_the_date_type.strftime("%A %d %B %Y")
+
+def _is_fixed_offset_iso(iso_string):
+    """Checks for the "YYYY-MM-DDTHH:MM:SS+HH:MM" layout used by the weather data.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        True if the string has the fixed-offset layout.
+    """
+
+    return (
+        len(iso_string) == 25
+        and iso_string[4] == "-" and iso_string[7] == "-" and iso_string[10] == "T"
+        and iso_string[13] == ":" and iso_string[16] == ":"
+        and iso_string[19] in "+-" and iso_string[22] == ":"
+    )
+
+def _date_names():
+    """Returns the weekday and month names strftime would use.
+
+    The names are worked out once, on first use, so that they follow the
+    current locale just like "%A" and "%B" do.
 
-    # Return the reformatted string
-    return formatted_date
+    Returns:
+        A tuple of (weekday names from Monday, month names from January).
+    """
+
+    global _DATE_NAMES
+    if _DATE_NAMES is None:
+        # 4 January 2021 was a Monday
+        day_names = [datetime(2021, 1, 4 + day).strftime("%A") for day in range(7)]
+        month_names = [datetime(2021, month, 1).strftime("%B") for month in range(1, 13)]
+        _DATE_NAMES = (day_names, month_names)
+    return _DATE_NAMES
+
+def configure_date_cache(maxsize=DATE_CACHE_SIZE):
+    """Resizes (and clears) the cache used by convert_date.
+
+    Args:
+        maxsize: The number of formatted dates to keep. 0 turns caching off
+            and None lets the cache grow without limit.
+    """
+
+    global _cached_format_date
+    _cached_format_date = lru_cache(maxsize=maxsize)(_format_date)
+
+def date_cache_info():
+    """Reports how well the convert_date cache is working.
+
+    Returns:
+        A named tuple of (hits, misses, maxsize, currsize).
+    """
+
+    return _cached_format_date.cache_info()
+
+def clear_date_cache():
+    """Empties the convert_date cache and resets its statistics."""
+
+    _cached_format_date.cache_clear()
+
+# Weekday and month names, filled in by _date_names
+_DATE_NAMES = None
+
+# Zero-padded day of the month numbers, like strftime's "%d"
+_DAY_NUMBERS = [f"{day:02d}" for day in range(32)]
+
+# Build the default convert_date cache
+configure_date_cache()
 
 # Call and print the function with the user's ISO date input
 # print(convert_date(get_iso_date_input))
@@ -55,13 +200,18 @@ def convert_f_to_c(temp_in_fahrenheit):
     """Converts a temperature from Fahrenheit to Celcius.
 
     Args:
-        temp_in_fahrenheit: float representing a temperature.
+        temp_in_fahrenheit: float representing a temperature, or a NumPy array of them.
     Returns:
         A float representing a temperature in degrees Celcius, rounded to 1 decimal place.
+        NumPy input gives a float64 array with the same rounding as the scalar path.
     """
 
     # Nano Notes: The Formula to convert Fahrenheit to Celsius is °C = (°F - 32) ÷ 1.8
 
+    # Convert a whole NumPy column at once (e.g. from a WeatherTable)
+    if _is_numpy_array(temp_in_fahrenheit):
+        return _convert_f_to_c_numpy(temp_in_fahrenheit)
+
     # Convert the user input into a float so that we can get a decimal result
     inputs = float(temp_in_fahrenheit)
 
@@ -74,6 +224,30 @@ def convert_f_to_c(temp_in_fahrenheit):
 # Call and print the function with the user's fahrenheit input
 # print(convert_f_to_c(get_fahrenheit_input))
 
+def convert_f_to_c_batch(temps_in_fahrenheit):
+    """Converts a whole sequence of temperatures from Fahrenheit to Celcius at once.
+
+    Args:
+        temps_in_fahrenheit: A NumPy array, or any sequence of values convert_f_to_c accepts.
+    Returns:
+        A float64 NumPy array for array input, otherwise a list of floats. Every
+        value is bit-identical to calling convert_f_to_c on it.
+    """
+
+    # Arrays go straight through the vectorized conversion
+    if _is_numpy_array(temps_in_fahrenheit):
+        return _convert_f_to_c_numpy(temps_in_fahrenheit)
+
+    # Weather data only has a few distinct values, so convert each one only once
+    converted = {}
+    results = []
+    for temp in temps_in_fahrenheit:
+        value = float(temp)
+        if value not in converted:
+            converted[value] = convert_f_to_c(value)
+        results.append(converted[value])
+    return results
+
 #-------------------------------------------------------------------#
 #                          Question Three:                          #
 #-------------------------------------------------------------------#
@@ -86,13 +260,17 @@ def calculate_mean(weather_data):
     """Calculates the mean value from a list of numbers.
 
     Args:
-        weather_data: a list of numbers.
+        weather_data: a list of numbers, or a NumPy array of them.
     Returns:
         A float representing the mean value.
     """
 
     # Nano Notes: The Formula to get the mean is Mean = total of all values ÷ number of values
 
+    # Use the vectorized path for NumPy columns (e.g. from a WeatherTable)
+    if _is_numpy_array(weather_data):
+        return _calculate_mean_numpy(weather_data)
+
     # Check that the list provided is empty
     if not weather_data:
         # If the list is empty, return 0
@@ -128,18 +306,56 @@ def calculate_mean(weather_data):
 # Ask the user to provide the CSV file name or path
 # get_csv_file_input = input("Enter the CSV file name (e.g. weather.csv): ")
 
-def load_data_from_csv(csv_file):
+def _parse_row(row):
+    """Cleans a single csv row into a [date, min, max] list.
 
-    """Reads a csv file and stores the data in a list.
+    Args:
+        row: A list of strings read from the csv file.
+    Returns:
+        A list containing the date string and the min and max values as ints.
+    """
+
+    # Extract and clean the date value
+    date = row[0].strip()
+
+    # Convert the min and max values via float to int
+    min = int(float(row[1]))
+    max = int(float(row[2]))
+
+    # Return the cleaned row
+    return [date, min, max]
+
+def iter_data_from_csv(csv_file, chunk_size=None, fast=False):
+    """Reads a csv file one row at a time without loading it all into memory.
 
     Args:
         csv_file: a string representing the file path to a csv file.
+        chunk_size: optional number of rows to group together. When given, lists
+            of up to chunk_size rows are yielded instead of single rows.
+        fast: if True, parse the file in large blocks (see iter_csv_blocks).
     Returns:
-        A list of lists, where each sublist is a (non-empty) line in the csv file.
+        A generator of [date, min, max] lists (or lists of them when chunk_size is set).
     """
 
-    # Create an empty list to store the weather data
-    data = []
+    # Hand the rows out in fixed-size groups if a chunk size was requested
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        chunk = []
+        for row in iter_data_from_csv(csv_file, fast=fast):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+
+    # Hand out the rows of each block parsed by the fast reader
+    if fast:
+        for rows in iter_csv_blocks(csv_file):
+            yield from rows
+        return
 
     # Open the CSV file in read mode
     with open(csv_file, "r", newline="") as f:
@@ -150,18 +366,9 @@ def load_data_from_csv(csv_file):
         header = next(reader, None)
 
         # Check if a header exists and if it is not ["date", "min", "max"]
-        if header and [h.strip().lower() for h in header] != ["date", "min", "max"]:
-            row = header
-            if row and any(cell.strip() for cell in row):
-                # Extract and clean the date value
-                date = row[0].strip()
-
-                # Convert the min and max values via float to int
-                min = int(float(row[1]))
-                max = int(float(row[2]))
-
-                # Append the cleaned row to the data list
-                data.append([date, min, max])
+        if header and not _is_header(header):
+            if any(cell.strip() for cell in header):
+                yield _parse_row(header)
 
         # Loop through each remaining row in the CSV file
         for row in reader:
@@ -169,18 +376,158 @@ def load_data_from_csv(csv_file):
             if not row or not any(cell.strip() for cell in row):
                 continue
 
-            # Extract and clean the date value
-            date = row[0].strip()
+            yield _parse_row(row)
+
+def load_data_from_csv(csv_file, as_table=False, fast=False, compact=False):
 
-            # Convert the min and max values via float to int
-            min = int(float(row[1]))
-            max = int(float(row[2]))
+    """Reads a csv file and stores the data in a list.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        as_table: if True, return a columnar WeatherTable instead (requires NumPy).
+        fast: if True, parse the file in large blocks (see iter_csv_blocks).
+        compact: if True, return a memory-saving CompactWeatherData instead.
+    Returns:
+        A list of lists, where each sublist is a (non-empty) line in the csv file.
+    """
 
-            # Append the cleaned row to the data list
-            data.append([date, min, max])
+    # Build the columnar table straight from the stream if asked to
+    if as_table:
+        return WeatherTable.from_rows(iter_data_from_csv(csv_file, fast=fast))
+    if compact:
+        return CompactWeatherData.from_rows(iter_data_from_csv(csv_file, fast=fast))
 
-    # Return the complete list of weather data
-    return data
+    # Join the fast reader's blocks together
+    if fast:
+        data = []
+        for rows in iter_csv_blocks(csv_file):
+            data.extend(rows)
+        return data
+
+    # Collect every row from the streaming reader into a list
+    return list(iter_data_from_csv(csv_file))
+
+def _is_header(row):
+    """Checks whether a csv row is the ["date", "min", "max"] header.
+
+    Args:
+        row: A list of strings read from the csv file.
+    Returns:
+        True if the row is the header row.
+    """
+
+    return [h.strip().lower() for h in row] == ["date", "min", "max"]
+
+def iter_csv_blocks(csv_file, block_size=CSV_BLOCK_SIZE):
+    """Reads a csv file in large blocks and parses each block's columns in bulk.
+
+    Gives exactly the same rows as iter_data_from_csv, including header
+    detection, blank-line skipping and int(float(...)) truncation, but avoids
+    most of the per-cell Python work.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        block_size: roughly how many characters to read at a time.
+    Returns:
+        A generator of lists of [date, min, max] rows, one list per block.
+    """
+
+    with open(csv_file, "r") as f:
+        leftover = ""
+        first_block = True
+        while True:
+            text = f.read(block_size)
+
+            # Only parse up to the last complete line and keep the rest for later
+            if text:
+                text = leftover + text
+                end = text.rfind("\n")
+                if end < 0:
+                    leftover = text
+                    continue
+                block, leftover = text[:end], text[end + 1:]
+
+            # At the end of the file, whatever is left is the last line
+            elif leftover:
+                block, leftover = leftover, ""
+            else:
+                return
+
+            # The first line of the file may be a header
+            if first_block:
+                first_block = False
+                first_line, _, rest = block.partition("\n")
+                header = next(csv.reader([first_line]), None)
+                if header and _is_header(header):
+                    block = rest
+                    if not block:
+                        continue
+
+            yield _parse_csv_block(block)
+
+def _parse_csv_block(text):
+    """Parses a block of complete csv lines into [date, min, max] rows.
+
+    Args:
+        text: Complete lines from the csv file, separated by newlines.
+    Returns:
+        A list of [date, min, max] rows.
+    """
+
+    # Plain three-column blocks (the usual case) are split in one go, and
+    # each column is converted as a whole
+    if _is_three_column_block(text):
+        cells = text.replace("\n", ",").split(",")
+        try:
+            min_temps = _parse_int_column(cells[1::3])
+            max_temps = _parse_int_column(cells[2::3])
+        except ValueError:
+            # Bad values: let the row by row path sort them out
+            pass
+        else:
+            dates = [date.strip() for date in cells[0::3]]
+            return list(map(list, zip(dates, min_temps, max_temps)))
+
+    # Anything else is parsed row by row, exactly like iter_data_from_csv
+    return [
+        _parse_row(row)
+        for row in csv.reader(text.split("\n"))
+        if row and any(cell.strip() for cell in row)
+    ]
+
+def _is_three_column_block(text):
+    """Checks whether every line of a block is three plain (unquoted) cells.
+
+    Args:
+        text: Complete lines from the csv file, separated by newlines.
+    Returns:
+        True if the block's columns can be split out in bulk.
+    """
+
+    if '"' in text:
+        return False
+    lines = text.split("\n")
+    return set(map(str.count, lines, repeat(",", len(lines)))) == {2}
+
+def _parse_int_column(column):
+    """Converts a whole column of strings to ints, truncating like int(float(...)).
+
+    Args:
+        column: A list of strings.
+    Returns:
+        A list of ints.
+    """
+
+    # Whole numbers (the usual case) can skip the float round-trip
+    try:
+        values = list(map(int, column))
+    except ValueError:
+        return [int(float(value)) for value in column]
+
+    # Very large numbers would lose precision going through float, so match that
+    if values and (max(values) >= _EXACT_FLOAT_LIMIT or min(values) <= -_EXACT_FLOAT_LIMIT):
+        return [int(float(value)) for value in column]
+    return values
 
 # Call and print the function with the user's CSV file input
 # print(load_data_from_csv(get_csv_file_input))
@@ -200,11 +547,15 @@ def find_min(weather_data):
     """Calculates the minimum value in a list of numbers.
 
     Args:
-        weather_data: A list of numbers.
+        weather_data: A list of numbers, or a NumPy array of them.
     Returns:
         The minimum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
     """
 
+    # Use the vectorized path for NumPy columns (e.g. from a WeatherTable)
+    if _is_numpy_array(weather_data):
+        return _find_extreme_numpy(weather_data, "argmin")
+
     # Check if the provided list is empty
     if not weather_data:
 
@@ -246,11 +597,15 @@ def find_max(weather_data):
     """Calculates the maximum value in a list of numbers.
 
     Args:
-        weather_data: A list of numbers.
+        weather_data: A list of numbers, or a NumPy array of them.
     Returns:
         The maximum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
     """
 
+    # Use the vectorized path for NumPy columns (e.g. from a WeatherTable)
+    if _is_numpy_array(weather_data):
+        return _find_extreme_numpy(weather_data, "argmax")
+
     # Check if the list is empty
     if not weather_data:
         # Return an empty tuple if it is
@@ -280,6 +635,226 @@ def find_max(weather_data):
 # Call and print the function with the user's list input
 # print(find_min(get_list_of_numbers_max_input))
 
+#-------------------------------------------------------------------#
+#                       Summary Accumulator:                        #
+#-------------------------------------------------------------------#
+
+def _render_summary(count, min_temp_f, min_date_iso, max_temp_f, max_date_iso, min_mean_f, max_mean_f):
+    """Builds the summary text shared by generate_summary and its helpers.
+
+    Args:
+        count: The number of days being summarised.
+        min_temp_f: The lowest minimum temperature in Fahrenheit.
+        min_date_iso: The ISO date on which the lowest temperature occurs.
+        max_temp_f: The highest maximum temperature in Fahrenheit.
+        max_date_iso: The ISO date on which the highest temperature occurs.
+        min_mean_f: The mean of the minimum temperatures in Fahrenheit.
+        max_mean_f: The mean of the maximum temperatures in Fahrenheit.
+    Returns:
+        A string containing the summary information.
+    """
+
+    # If there was no data, return the default summary
+    if not count:
+        return (
+            "0 Day Overview\n"
+            "  The lowest temperature will be 0.0°C, and will occur on .\n"
+            "  The highest temperature will be 0.0°C, and will occur on .\n"
+            "  The average low this week is 0.0°C.\n"
+            "  The average high this week is 0.0°C.\n"
+        )
+
+    # Convert min and max temps to Celsius and their dates to readable format
+    min_temp_c = format_temperature(convert_f_to_c(min_temp_f))
+    min_temp_date = convert_date(min_date_iso)
+    max_temp_c = format_temperature(convert_f_to_c(max_temp_f))
+    max_temp_date = convert_date(max_date_iso)
+
+    # Calculate average low and high temps in Celsius
+    average_min_c = format_temperature(round(convert_f_to_c(min_mean_f), 1))
+    average_max_c = format_temperature(round(convert_f_to_c(max_mean_f), 1))
+
+    # Construct the summary string
+    return (
+        f"{count} Day Overview\n"
+        f"  The lowest temperature will be {min_temp_c}, and will occur on {min_temp_date}.\n"
+        f"  The highest temperature will be {max_temp_c}, and will occur on {max_temp_date}.\n"
+        f"  The average low this week is {average_min_c}.\n"
+        f"  The average high this week is {average_max_c}.\n"
+    )
+
+class SummaryAccumulator:
+    """Builds a weather summary incrementally, one row at a time.
+
+    Only the running count, totals and the current lowest/highest values are
+    kept, so memory use stays constant no matter how many rows are added. The
+    rendered text is identical to generate_summary for the same rows.
+    """
+
+    def __init__(self):
+        # Number of rows seen so far
+        self.count = 0
+
+        # Lowest minimum temperature (Fahrenheit), its date and its row index
+        self.min_temp = None
+        self.min_date = None
+        self.min_index = None
+
+        # Highest maximum temperature (Fahrenheit), its date and its row index
+        self.max_temp = None
+        self.max_date = None
+        self.max_index = None
+
+        # Running totals used for the means
+        self.min_total = 0.0
+        self.max_total = 0.0
+
+    def add(self, row):
+        """Adds a single [date, min, max] row to the summary.
+
+        Args:
+            row: A list representing a day of weather data.
+        """
+
+        min_value = float(row[1])
+        max_value = float(row[2])
+
+        # Use <= and >= so the *last* occurrence wins, like find_min and find_max
+        if self.min_temp is None or min_value <= self.min_temp:
+            self.min_temp = min_value
+            self.min_date = row[0]
+            self.min_index = self.count
+        if self.max_temp is None or max_value >= self.max_temp:
+            self.max_temp = max_value
+            self.max_date = row[0]
+            self.max_index = self.count
+
+        # Keep running totals for the averages
+        self.min_total += min_value
+        self.max_total += max_value
+        self.count += 1
+
+    def update(self, weather_data):
+        """Adds every row from an iterable of rows.
+
+        Args:
+            weather_data: Any iterable of [date, min, max] rows.
+        Returns:
+            The accumulator itself, so calls can be chained.
+        """
+
+        # Compact data can be summarised straight from its columns
+        if isinstance(weather_data, CompactWeatherData):
+            vars(self).update(vars(self.merge(weather_data.summary_accumulator())))
+            return self
+
+        for row in weather_data:
+            self.add(row)
+        return self
+
+    def merge(self, other):
+        """Combines this summary with one covering the rows that come after it.
+
+        Merging is associative, so shards can be combined in any grouping as
+        long as they stay in order. Ties still go to the *last* occurrence,
+        across shard boundaries too. The means match a single pass exactly for
+        whole-number temperatures (such as those from load_data_from_csv).
+
+        Args:
+            other: A SummaryAccumulator for the rows following this one's.
+        Returns:
+            A new SummaryAccumulator covering both sets of rows.
+        """
+
+        merged = SummaryAccumulator.from_dict(self.to_dict())
+
+        # The later shard wins ties, and its positions move past this shard's rows
+        if other.count and (merged.min_temp is None or other.min_temp <= merged.min_temp):
+            merged.min_temp = other.min_temp
+            merged.min_date = other.min_date
+            merged.min_index = self.count + other.min_index
+        if other.count and (merged.max_temp is None or other.max_temp >= merged.max_temp):
+            merged.max_temp = other.max_temp
+            merged.max_date = other.max_date
+            merged.max_index = self.count + other.max_index
+
+        merged.min_total += other.min_total
+        merged.max_total += other.max_total
+        merged.count += other.count
+        return merged
+
+    def to_dict(self):
+        """Converts the summary state into a JSON-friendly dict.
+
+        Returns:
+            A dict that from_dict turns back into an equal accumulator.
+        """
+
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuilds an accumulator saved with to_dict.
+
+        Args:
+            state: A dict produced by to_dict (e.g. after a JSON round-trip).
+        Returns:
+            A SummaryAccumulator with the same state.
+        """
+
+        accumulator = cls()
+        for name in vars(accumulator):
+            setattr(accumulator, name, state[name])
+        return accumulator
+
+    @property
+    def min_mean(self):
+        """The mean of the minimum temperatures in Fahrenheit (0 if empty)."""
+        return self.min_total / self.count if self.count else 0
+
+    @property
+    def max_mean(self):
+        """The mean of the maximum temperatures in Fahrenheit (0 if empty)."""
+        return self.max_total / self.count if self.count else 0
+
+    def summary(self):
+        """Renders the summary text, exactly as generate_summary would.
+
+        Returns:
+            A string containing the summary information.
+        """
+
+        return _render_summary(
+            self.count,
+            self.min_temp, self.min_date,
+            self.max_temp, self.max_date,
+            self.min_mean, self.max_mean,
+        )
+
+    def __str__(self):
+        return self.summary()
+
+def merge_summaries(partials):
+    """Merges partial summaries of consecutive shards into one.
+
+    For whole-number temperatures (such as those from load_data_from_csv) the
+    merged summary renders exactly like generate_summary on all the rows.
+    With fractional temperatures the shard totals are rounded separately, so
+    a mean that lands on a rounding boundary can come out 0.1°C different.
+
+    Args:
+        partials: SummaryAccumulator objects (or to_dict states), in row order.
+    Returns:
+        A SummaryAccumulator covering every shard.
+    """
+
+    merged = SummaryAccumulator()
+    for partial in partials:
+        if isinstance(partial, dict):
+            partial = SummaryAccumulator.from_dict(partial)
+        merged = merged.merge(partial)
+    return merged
+
 #-------------------------------------------------------------------#
 #                          Question Seven:                          #
 #-------------------------------------------------------------------#
@@ -362,56 +937,13 @@ def generate_summary(weather_data):
 
     Args:
         weather_data: A list of lists, where each sublist represents a day of weather data.
+            Any iterable of rows works, e.g. the output of iter_data_from_csv.
     Returns:
         A string containing the summary information.
     """
 
-    # If the weather_data list is empty, return the default summary
-    if not weather_data:
-        return (
-            "0 Day Overview\n"
-            "  The lowest temperature will be 0.0°C, and will occur on .\n"
-            "  The highest temperature will be 0.0°C, and will occur on .\n"
-            "  The average low this week is 0.0°C.\n"
-            "  The average high this week is 0.0°C.\n"
-        )
-
-    # Extract all the min and max values (in Fahrenheit)
-    min_temps = [float(row[1]) for row in weather_data]
-    max_temps = [float(row[2]) for row in weather_data]
-
-    # Extract all the dates
-    dates = [row[0] for row in weather_data]
-
-    # Find the minimum temperature and its index
-    min_temp_f, min_index = find_min(min_temps)
-    # Convert min temp to Celsius
-    min_temp_c = format_temperature(convert_f_to_c(min_temp_f))
-    # Convert corresponding date to readable format
-    min_temp_date = convert_date(dates[min_index])
-
-    # Find the maximum temperature and its index
-    max_temp_f, max_index = find_max(max_temps)
-    # Convert max temp to Celsius
-    max_temp_c = format_temperature(convert_f_to_c(max_temp_f))
-    # Convert corresponding date to readable format
-    max_temp_date = convert_date(dates[max_index])
-
-    # Calculate average low and high temps in Celsius
-    average_min_c = format_temperature(round(convert_f_to_c(calculate_mean(min_temps)), 1))
-    average_max_c = format_temperature(round(convert_f_to_c(calculate_mean(max_temps)), 1))
-
-    # Construct the summary string
-    summary = (
-        f"{len(weather_data)} Day Overview\n"
-        f"  The lowest temperature will be {min_temp_c}, and will occur on {min_temp_date}.\n"
-        f"  The highest temperature will be {max_temp_c}, and will occur on {max_temp_date}.\n"
-        f"  The average low this week is {average_min_c}.\n"
-        f"  The average high this week is {average_max_c}.\n"
-    )
-
-    # Return the full summary
-    return summary
+    # Feed every row through the accumulator in a single pass and render it
+    return SummaryAccumulator().update(weather_data).summary()
 
 #-------------------------------------------------------------------#
 #                          Question Eight:                          #
@@ -479,37 +1011,2423 @@ def generate_daily_summary(weather_data):
 
     Args:
         weather_data: A list of lists, where each sublist represents a day of weather data.
+            Any iterable of rows works, e.g. the output of iter_data_from_csv.
     Returns:
         A string containing the summary information.
     """
 
-    # If the data list is empty, return an empty string
-    if not weather_data:
-        return ""
+    # Join each chunk's blocks, then the chunks, in one go each
+    return "".join(["".join(blocks) for blocks in _daily_summary_chunks(weather_data)])
+
+def iter_daily_summary(weather_data):
+    """Generates the daily summary one day's block at a time.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows.
+    Returns:
+        A generator of strings, one block per day, which join to generate_daily_summary.
+    """
+
+    for blocks in _daily_summary_chunks(weather_data):
+        yield from blocks
 
-    # Create an empty string to store all daily summaries
-    daily_summary = ""
+def _daily_summary_chunks(weather_data):
+    """Renders the daily summary a chunk of days at a time.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows.
+    Returns:
+        A generator of lists of day blocks.
+    """
 
-    # Loop through each day's data
-    for row in weather_data:
-        # Extract date, min temp (F), and max temp (F)
-        date_iso = row[0]
-        min_temp_f = float(row[1])
-        max_temp_f = float(row[2])
+    # Work through the data in chunks so whole columns are converted and formatted together
+    rows = iter(weather_data)
+    while True:
+        chunk = list(islice(rows, _DAILY_CHUNK_SIZE))
+        if not chunk:
+            break
 
-        # Convert temperatures to Celsius and format them
-        min_temp_c = format_temperature(convert_f_to_c(min_temp_f))
-        max_temp_c = format_temperature(convert_f_to_c(max_temp_f))
+        # Convert the chunk's min and max temps (F) to Celsius and format them
+        min_temps_c = format_temperature_batch(convert_f_to_c_batch([row[1] for row in chunk]))
+        max_temps_c = format_temperature_batch(convert_f_to_c_batch([row[2] for row in chunk]))
 
-        # Convert date to readable format
-        readable_date = convert_date(date_iso)
+        # Convert the dates to readable format
+        readable_dates = [convert_date(row[0]) for row in chunk]
 
-        # Append this day's summary to the overall string
-        daily_summary += (
+        # Build every day's block for the chunk
+        yield [
             f"---- {readable_date} ----\n"
             f"  Minimum Temperature: {min_temp_c}\n"
             f"  Maximum Temperature: {max_temp_c}\n\n"
-        )
+            for readable_date, min_temp_c, max_temp_c in zip(readable_dates, min_temps_c, max_temps_c)
+        ]
+
+def write_daily_summary(weather_data, output_file):
+    """Writes the daily summary straight to a file-like object.
+
+    Nothing larger than one chunk of days is held in memory, so this suits
+    very long date ranges.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows.
+        output_file: An object with a write method, e.g. an open text file.
+    Returns:
+        The number of days written.
+    """
+
+    days = 0
+    for blocks in _daily_summary_chunks(weather_data):
+        output_file.write("".join(blocks))
+        days += len(blocks)
+    return days
+
+#-------------------------------------------------------------------#
+#                      Columnar Weather Table:                      #
+#-------------------------------------------------------------------#
+
+# Offset stored for dates that had no UTC offset in the source data
+_NAIVE_OFFSET = -2**31
+
+# Number of values summed at a time by the vectorized mean
+_MEAN_BLOCK_SIZE = 1 << 16
+
+# Above this magnitude a float64 has no room left for a fractional digit
+_EXACT_FLOAT_LIMIT = 2.0**52
+
+# How close to a .5 boundary a scaled value must be to need the exact rounding path
+_ROUNDING_TOLERANCE = 1e-6
+
+def _import_numpy():
+    """Imports NumPy on first use so the rest of the module works without it.
+
+    Returns:
+        The numpy module.
+    """
+
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("NumPy is required for WeatherTable and the vectorized functions") from error
+    return numpy
+
+def _is_numpy_array(values):
+    """Checks whether values is a NumPy array without importing NumPy.
+
+    Args:
+        values: Any object.
+    Returns:
+        True if values is a numpy.ndarray.
+    """
+
+    # If NumPy was never imported, nothing can be an ndarray
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+def _find_extreme_numpy(values, method):
+    """Vectorized find_min/find_max with last-index tie-breaking.
+
+    Args:
+        values: A NumPy array of numbers.
+        method: Either "argmin" or "argmax".
+    Returns:
+        The extreme value and its position, or an empty tuple for empty input.
+    """
+
+    numpy = _import_numpy()
+    values = numpy.asarray(values, dtype=numpy.float64)
+    if not len(values):
+        return ()
+
+    # argmin/argmax return the first match, so search the reversed view for the last one
+    index = len(values) - 1 - int(getattr(values[::-1], method)())
+    return (float(values[index]), index)
+
+def _calculate_mean_numpy(values):
+    """Vectorized calculate_mean that adds values in the same order as the list path.
+
+    Args:
+        values: A NumPy array of numbers.
+    Returns:
+        A float representing the mean value, or 0 for empty input.
+    """
+
+    numpy = _import_numpy()
+    if not len(values):
+        return 0
+
+    # cumsum adds strictly left to right, so the total matches the Python loop bit for bit
+    total = 0.0
+    for start in range(0, len(values), _MEAN_BLOCK_SIZE):
+        block = numpy.array(values[start:start + _MEAN_BLOCK_SIZE], dtype=numpy.float64)
+        block[0] += total
+        total = float(numpy.cumsum(block)[-1])
+    return total / len(values)
+
+def _convert_f_to_c_numpy(values):
+    """Vectorized convert_f_to_c with the same rounding as Python's round.
+
+    rint(c * 10) / 10 gives the same double as round(c, 1) unless c * 10 lands
+    next to a .5 boundary (where the multiplication error can tip it), is too
+    large to hold a fractional digit, or is not finite. Those few values are
+    rounded with the scalar function instead.
+
+    Args:
+        values: A NumPy array of temperatures in Fahrenheit.
+    Returns:
+        A float64 NumPy array of temperatures in Celsius.
+    """
+
+    numpy = _import_numpy()
+    values = numpy.asarray(values, dtype=numpy.float64)
+
+    # Apply the formula exactly as the scalar path does
+    celsius = (values - 32) / 1.8
+
+    # Round to 1 decimal place the fast way
+    scaled = celsius * 10
+    with numpy.errstate(invalid="ignore"):
+        results = numpy.rint(scaled) / 10
+
+        # Find the values where the fast way might disagree with round()
+        uncertain = ~numpy.isfinite(scaled) | (numpy.abs(scaled) >= _EXACT_FLOAT_LIMIT)
+        uncertain |= numpy.abs(scaled - numpy.floor(scaled) - 0.5) <= _ROUNDING_TOLERANCE
+
+    # Round those with Python's own round
+    for index in zip(*numpy.nonzero(uncertain)):
+        results[index] = round(float(celsius[index]), 1)
+    return results
+
+class WeatherTable:
+    """Columnar weather data backed by NumPy arrays.
+
+    Holds a datetime64 column with the local (wall clock) time of each day,
+    the UTC offset of each date in seconds, and float32 min/max columns in
+    Fahrenheit. Iterating a table gives [date, min, max] rows that can be
+    passed to generate_summary and generate_daily_summary, while find_min,
+    find_max, calculate_mean and convert_f_to_c run vectorized on its columns.
+
+    The rows match load_data_from_csv for files of "YYYY-MM-DDTHH:MM:SS"
+    dates (with or without an offset) and whole-number temperatures, as
+    load_data_from_csv produces. Other data is normalised rather than kept
+    as written: dates are rebuilt by isoformat ("2021-07-05" comes back as
+    "2021-07-05T00:00:00") and fractional temperatures come back as their
+    float32 value (50.3 as 50.29999923706055).
+    """
+
+    def __init__(self, dates, min_temps, max_temps, utc_offsets=None):
+        numpy = _import_numpy()
+
+        # Store every column with its fixed dtype
+        self.dates = numpy.asarray(dates, dtype="datetime64[s]")
+        self.min_temps = numpy.asarray(min_temps, dtype=numpy.float32)
+        self.max_temps = numpy.asarray(max_temps, dtype=numpy.float32)
+        if utc_offsets is None:
+            utc_offsets = numpy.full(len(self.dates), _NAIVE_OFFSET)
+        self.utc_offsets = numpy.asarray(utc_offsets, dtype=numpy.int32)
+
+        # All columns must describe the same days
+        if not len(self.dates) == len(self.min_temps) == len(self.max_temps) == len(self.utc_offsets):
+            raise ValueError("WeatherTable columns must all have the same length")
+
+    @classmethod
+    def from_rows(cls, weather_data):
+        """Builds a table from [date, min, max] rows.
+
+        Args:
+            weather_data: Any iterable of rows, e.g. from iter_data_from_csv.
+        Returns:
+            A WeatherTable holding the same data.
+        """
+
+        dates, offsets, min_temps, max_temps = [], [], [], []
+        for row in weather_data:
+            # Split each ISO date into its wall clock time and UTC offset
+            moment = datetime.fromisoformat(row[0])
+            offset = moment.utcoffset()
+            dates.append(moment.replace(tzinfo=None))
+            offsets.append(_NAIVE_OFFSET if offset is None else int(offset.total_seconds()))
+            min_temps.append(float(row[1]))
+            max_temps.append(float(row[2]))
+        return cls(dates, min_temps, max_temps, offsets)
+
+    def iso_dates(self):
+        """Rebuilds the ISO date strings for every row.
+
+        Returns:
+            A list of ISO date strings.
+        """
+
+        iso_dates = []
+        for moment, offset in zip(self.dates.astype(object), self.utc_offsets.tolist()):
+            if offset != _NAIVE_OFFSET:
+                moment = moment.replace(tzinfo=timezone(timedelta(seconds=offset)))
+            iso_dates.append(moment.isoformat())
+        return iso_dates
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __iter__(self):
+        # Hand out plain Python values (whole numbers as ints, like load_data_from_csv)
+        for date, min_temp, max_temp in zip(self.iso_dates(), self.min_temps.tolist(), self.max_temps.tolist()):
+            yield [date, _plain_number(min_temp), _plain_number(max_temp)]
+
+def _plain_number(value):
+    """Turns a whole-number float back into an int.
+
+    Args:
+        value: A float read from a numeric column.
+    Returns:
+        An int if value has no fractional part, otherwise value unchanged.
+    """
+
+    return int(value) if value.is_integer() else value
+
+#-------------------------------------------------------------------#
+#                      Multi-file Summaries:                        #
+#-------------------------------------------------------------------#
+
+class FileSummary(NamedTuple):
+    """The outcome of summarising one csv file in a batch."""
+
+    # The csv file path, as given to summarise_files
+    path: str
+
+    # The generate_summary text, or None if the file failed
+    summary: str = None
+
+    # A description of what went wrong, or None if the file succeeded
+    error: str = None
+
+def _summarise_file(csv_file):
+    """Loads and summarises one csv file, capturing any error.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A FileSummary for the file.
+    """
+
+    try:
+        return FileSummary(csv_file, summary=generate_summary(iter_data_from_csv(csv_file)))
+    except Exception as error:
+        return FileSummary(csv_file, error=f"{type(error).__name__}: {error}")
+
+def summarise_files(csv_files, max_workers=None):
+    """Summarises many csv files in parallel over a process pool.
+
+    Args:
+        csv_files: a glob pattern (e.g. "data/*.csv") or a list of csv file paths.
+        max_workers: the number of worker processes. None uses one per CPU and
+            1 summarises every file in the current process.
+    Returns:
+        A list of FileSummary results, in the same order as the files (glob
+        matches are sorted). A file that fails gets an error instead of a
+        summary and does not stop the rest of the batch.
+    """
+
+    # Expand a glob pattern into a stable, sorted list of files
+    if isinstance(csv_files, str):
+        csv_files = sorted(glob.glob(csv_files))
+    else:
+        csv_files = list(csv_files)
+
+    # No need for a pool when only one worker is wanted
+    if max_workers == 1 or not csv_files:
+        return [_summarise_file(csv_file) for csv_file in csv_files]
+
+    # Fan the files out over the pool and collect them back in order
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_summarise_file, csv_file) for csv_file in csv_files]
+        for csv_file, future in zip(csv_files, futures):
+            try:
+                results.append(future.result())
+            except Exception as error:
+                # The worker itself died (e.g. the pool broke), not just the file
+                results.append(FileSummary(csv_file, error=f"{type(error).__name__}: {error}"))
+    return results
+
+#-------------------------------------------------------------------#
+#                        Binary Data Cache:                         #
+#-------------------------------------------------------------------#
+
+# File name suffix load_data_cached uses when no cache file is given
+CACHE_SUFFIX = ".wcache"
+
+# Cache header: magic, version, byte order, padding, row count, source mtime (ns), source size
+_CACHE_HEADER = struct.Struct("=4sBBHqqq")
+_CACHE_MAGIC = b"WTHR"
+_CACHE_VERSION = 1
+_CACHE_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+# Dates are stored as seconds since this (wall clock) moment
+_EPOCH = datetime(1970, 1, 1)
+
+# Range of values an int16 temperature column can hold
+_INT16_RANGE = range(-2**15, 2**15)
+
+# Smallest cache worth handing to NumPy to format its dates
+_NUMPY_DECODE_THRESHOLD = 10000
+
+def _encode_iso_date(iso_string):
+    """Splits an ISO date into wall clock seconds since 1970 and a UTC offset.
+
+    Microseconds are dropped, so callers should check the date round-trips.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        A tuple of (seconds, offset in seconds or _NAIVE_OFFSET).
+    """
+
+    moment = datetime.fromisoformat(iso_string)
+    offset = moment.utcoffset()
+    seconds = (moment.replace(tzinfo=None) - _EPOCH) // timedelta(seconds=1)
+    return seconds, _NAIVE_OFFSET if offset is None else int(offset.total_seconds())
+
+def _encode_iso_dates(iso_dates):
+    """Encodes a whole column of ISO dates with _encode_iso_date.
+
+    Dates in the usual "YYYY-MM-DDTHH:MM:SS" layout (with or without an
+    offset) are split into their day, time of day and offset, and each of
+    those is only parsed once.
+
+    Args:
+        iso_dates: A list of ISO date strings.
+    Returns:
+        A tuple of (int64 array of seconds, int32 array of offsets).
+    """
+
+    dates, offsets = array("q"), array("i")
+    days, times, zones = {}, {}, {}
+    for iso_string in iso_dates:
+        # Anything in an unusual layout (e.g. no seconds) goes through the general encoder
+        if len(iso_string) < 19 or iso_string[10] != "T" or iso_string[13] != ":" or iso_string[16] != ":":
+            seconds, offset = _encode_iso_date(iso_string)
+            dates.append(seconds)
+            offsets.append(offset)
+            continue
+
+        # Parse the pieces the first time they are seen
+        day = days.get(iso_string[:10])
+        if day is None:
+            day = days[iso_string[:10]] = (datetime.fromisoformat(iso_string[:10]) - _EPOCH).days
+        time_of_day = times.get(iso_string[11:19])
+        if time_of_day is None:
+            moment = datetime.fromisoformat(f"1970-01-01T{iso_string[11:19]}")
+            time_of_day = times[iso_string[11:19]] = (moment - _EPOCH) // timedelta(seconds=1)
+        offset = zones.get(iso_string[19:])
+        if offset is None:
+            offset = zones[iso_string[19:]] = _encode_iso_date(f"1970-01-01T00:00:00{iso_string[19:]}")[1]
+
+        dates.append(day * 86400 + time_of_day)
+        offsets.append(offset)
+    return dates, offsets
+
+def _decode_iso_dates(dates, utc_offsets):
+    """Rebuilds the ISO date strings written by _encode_iso_date.
+
+    Args:
+        dates: An array of wall clock seconds since 1970 for each row.
+        utc_offsets: An array of UTC offsets in seconds (or _NAIVE_OFFSET) for each row.
+    Returns:
+        A list of ISO date strings.
+    """
+
+    # Format each distinct offset once (station files usually have just one)
+    suffixes = {offset: _offset_suffix(offset) for offset in set(utc_offsets)}
+
+    # Large columns are formatted by NumPy when it is available
+    wall_clock = None
+    if len(dates) >= _NUMPY_DECODE_THRESHOLD:
+        wall_clock = _format_wall_clock_numpy(dates)
+    if wall_clock is None:
+        wall_clock = _format_wall_clock(dates)
+
+    # Stick the offsets on the end
+    if len(suffixes) == 1:
+        suffix = suffixes.popitem()[1]
+        return [text + suffix for text in wall_clock]
+    return [text + suffixes[offset] for text, offset in zip(wall_clock, utc_offsets)]
+
+def _offset_suffix(offset):
+    """Formats a UTC offset the way datetime.isoformat does, e.g. "+08:00".
+
+    Args:
+        offset: The UTC offset in seconds, or _NAIVE_OFFSET.
+    Returns:
+        The offset text, or "" for dates without an offset.
+    """
+
+    if offset == _NAIVE_OFFSET:
+        return ""
+    return _EPOCH.replace(tzinfo=timezone(timedelta(seconds=offset))).isoformat()[19:]
+
+def _format_wall_clock(dates):
+    """Formats seconds since 1970 as "YYYY-MM-DDTHH:MM:SS" strings.
+
+    Each distinct day and time of day is only formatted once, which is far
+    quicker than building a datetime for every row.
+
+    Args:
+        dates: An array of wall clock seconds since 1970.
+    Returns:
+        A list of strings.
+    """
+
+    days, times = {}, {}
+    wall_clock = []
+    for seconds in dates:
+        day, time_of_day = divmod(seconds, 86400)
+
+        # Format the pieces the first time they are seen
+        day_text = days.get(day)
+        if day_text is None:
+            day_text = days[day] = (_EPOCH + timedelta(days=day)).date().isoformat()
+        time_text = times.get(time_of_day)
+        if time_text is None:
+            hours, rest = divmod(time_of_day, 3600)
+            time_text = times[time_of_day] = f"T{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+
+        wall_clock.append(day_text + time_text)
+    return wall_clock
+
+def _format_wall_clock_numpy(dates):
+    """Formats seconds since 1970 as "YYYY-MM-DDTHH:MM:SS" strings using NumPy.
+
+    Args:
+        dates: An int64 array (or memoryview) of wall clock seconds since 1970.
+    Returns:
+        A list of strings, or None if NumPy is not installed.
+    """
+
+    try:
+        numpy = _import_numpy()
+    except ImportError:
+        return None
+    return numpy.frombuffer(dates, dtype="datetime64[s]").astype("U19").tolist()
+
+def write_data_cache(weather_data, cache_file, csv_file, source=None):
+    """Writes weather rows to a binary cache file tied to their csv source.
+
+    The cache holds an int64 column of dates, an int32 column of UTC offsets
+    and int16 min/max columns. Rows whose date would not come back as exactly
+    the same string, or whose temperatures don't fit in an int16, can't be
+    cached; nothing is written in that case.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows loaded from csv_file.
+        cache_file: The path of the cache file to write.
+        csv_file: The csv file the rows came from, used to detect stale caches.
+        source: os.stat(csv_file) taken before the rows were read. Defaults to
+            a fresh stat, which is only right if the file can't have changed since.
+    Returns:
+        True if the cache was written, False if the rows can't be cached.
+    """
+
+    if source is None:
+        source = os.stat(csv_file)
+    if not isinstance(weather_data, list):
+        weather_data = list(weather_data)
+
+    # Pack every column, giving up on anything the format can't hold
+    try:
+        min_temps = array("h", [row[1] for row in weather_data])
+        max_temps = array("h", [row[2] for row in weather_data])
+        iso_dates = [row[0] for row in weather_data]
+        dates, offsets = _encode_iso_dates(iso_dates)
+    except (OverflowError, TypeError, ValueError):
+        return False
+
+    # Every date has to come back as exactly the same string
+    if _decode_iso_dates(dates, offsets) != iso_dates:
+        return False
+
+    # Write to a temporary file first so readers never see half a cache
+    header = _CACHE_HEADER.pack(
+        _CACHE_MAGIC, _CACHE_VERSION, _CACHE_BYTE_ORDER, 0,
+        len(dates), source.st_mtime_ns, source.st_size,
+    )
+    temporary_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file, "wb") as f:
+            f.write(header)
+            for column in (dates, offsets, min_temps, max_temps):
+                column.tofile(f)
+        os.replace(temporary_file, cache_file)
+    except OSError:
+        # Don't leave a half-written temporary file behind
+        try:
+            os.remove(temporary_file)
+        except OSError:
+            pass
+        raise
+    return True
+
+class MappedWeatherData:
+    """Weather rows read straight from a memory-mapped cache file.
+
+    The dates, utc_offsets, min_temps and max_temps columns are memoryviews
+    over the mapped file, so opening a cache copies nothing. Iterating gives
+    the same [date, min, max] rows as load_data_from_csv.
+    """
+
+    def __init__(self, cache_file):
+        import mmap
+
+        with open(cache_file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, byte_order, _, count, self.source_mtime_ns, self.source_size = (
+                _CACHE_HEADER.unpack_from(self._map)
+            )
+            if (magic, version, byte_order) != (_CACHE_MAGIC, _CACHE_VERSION, _CACHE_BYTE_ORDER):
+                raise ValueError(f"{cache_file} is not a weather cache file")
+            if len(self._map) != _CACHE_HEADER.size + count * (8 + 4 + 2 + 2):
+                raise ValueError(f"{cache_file} is truncated")
+
+            # Lay each column over its slice of the file
+            view = memoryview(self._map)
+            self._views = [view]
+            position = _CACHE_HEADER.size
+            columns = []
+            for code, width in (("q", 8), ("i", 4), ("h", 2), ("h", 2)):
+                column = view[position:position + count * width].cast(code)
+                self._views.append(column)
+                columns.append(column)
+                position += count * width
+            self.dates, self.utc_offsets, self.min_temps, self.max_temps = columns
+        except Exception:
+            self.close()
+            raise
+
+    def is_fresh(self, csv_file):
+        """Checks that the csv file hasn't changed since the cache was written.
+
+        Args:
+            csv_file: The csv file the cache was built from.
+        Returns:
+            True if the csv file's mtime and size still match.
+        """
+
+        source = os.stat(csv_file)
+        return (source.st_mtime_ns, source.st_size) == (self.source_mtime_ns, self.source_size)
+
+    def close(self):
+        """Releases the column views and unmaps the file."""
+
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __iter__(self):
+        for date, min_temp, max_temp in zip(_decode_iso_dates(self.dates, self.utc_offsets), self.min_temps, self.max_temps):
+            yield [date, min_temp, max_temp]
+
+    def rows(self):
+        """Builds the full list of [date, min, max] rows in one go.
+
+        Returns:
+            The same list of rows as load_data_from_csv.
+        """
+
+        return list(map(list, zip(_decode_iso_dates(self.dates, self.utc_offsets), self.min_temps, self.max_temps)))
+
+def load_data_cached(csv_file, cache_file=None):
+    """Loads a csv file, using a binary cache of it whenever one is up to date.
+
+    The first load parses the csv file and writes the cache; later loads map
+    the cache instead of parsing. The cache is rebuilt whenever the csv
+    file's modification time or size changes.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        cache_file: where to keep the cache. Defaults to csv_file + CACHE_SUFFIX.
+    Returns:
+        The same list of [date, min, max] rows as load_data_from_csv.
+    """
+
+    if cache_file is None:
+        cache_file = csv_file + CACHE_SUFFIX
+
+    # Use the cache if it exists, is readable and matches the csv file
+    try:
+        with MappedWeatherData(cache_file) as cached:
+            if cached.is_fresh(csv_file):
+                return cached.rows()
+    except (OSError, ValueError, struct.error):
+        pass
+
+    # Otherwise parse the csv file and (re)build the cache for next time. The
+    # cache is stamped with the file as it was before parsing, so a file that
+    # changes part way through just makes the cache stale
+    source = os.stat(csv_file)
+    data = load_data_from_csv(csv_file, fast=True)
+    try:
+        write_data_cache(data, cache_file, csv_file, source)
+    except OSError:
+        # A cache that can't be written (e.g. a read-only directory) only costs speed
+        pass
+    return data
+
+#-------------------------------------------------------------------#
+#                          Instrumentation:                         #
+#-------------------------------------------------------------------#
+
+# Functions timed by enable_instrumentation, one stage each
+INSTRUMENTED_STAGES = [
+    "load_data_from_csv",
+    "convert_date",
+    "convert_f_to_c",
+    "convert_f_to_c_batch",
+    "format_temperature",
+    "format_temperature_batch",
+    "_render_summary",
+    "generate_summary",
+    "generate_daily_summary",
+    "write_daily_summary",
+]
+
+class Instrumentation:
+    """Per-stage call counts, wall time and allocated bytes for a summary run.
+
+    Times are inclusive, so a stage that calls another (generate_summary
+    calling convert_date, say) includes the time spent in it.
+    """
+
+    def __init__(self, callback=None, track_memory=False):
+        # The function called after every instrumented call, if any
+        self.callback = callback
+
+        # Whether to measure allocated bytes with tracemalloc (much slower)
+        self.track_memory = track_memory
+
+        # Stage name -> {"calls": ..., "seconds": ..., "allocated_bytes": ...}
+        self.stages = {}
+
+    def record(self, stage, seconds, allocated_bytes):
+        """Adds one call to a stage's totals and passes it on to the callback.
+
+        Args:
+            stage: The name of the instrumented function.
+            seconds: The wall time the call took.
+            allocated_bytes: The memory the call left allocated (0 when not tracked).
+        """
+
+        totals = self.stages.get(stage)
+        if totals is None:
+            totals = self.stages[stage] = {"calls": 0, "seconds": 0.0, "allocated_bytes": 0}
+        totals["calls"] += 1
+        totals["seconds"] += seconds
+        totals["allocated_bytes"] += allocated_bytes
+        if self.callback is not None:
+            self.callback(stage, seconds, allocated_bytes)
+
+    def report(self):
+        """Builds a structured report of every stage seen so far.
+
+        Returns:
+            A dict mapping each stage name to its calls, seconds and allocated_bytes.
+        """
+
+        return {stage: dict(totals) for stage, totals in self.stages.items()}
+
+    def to_json(self, **kwargs):
+        """Exports the report as JSON.
+
+        Args:
+            **kwargs: Passed on to json.dumps, e.g. indent=2.
+        Returns:
+            A JSON string.
+        """
+
+        import json
+
+        return json.dumps(self.report(), **kwargs)
+
+    def wrap(self, stage, function):
+        """Wraps a function so that every call to it is recorded.
+
+        Args:
+            stage: The stage name to record calls under.
+            function: The function to wrap.
+        Returns:
+            The wrapped function.
+        """
+
+        import tracemalloc
+
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+            allocated_before = tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                allocated = tracemalloc.get_traced_memory()[0] - allocated_before if self.track_memory else 0
+                self.record(stage, seconds, max(allocated, 0))
+        return instrumented
+
+def enable_instrumentation(callback=None, track_memory=False):
+    """Starts recording every call to the INSTRUMENTED_STAGES functions.
+
+    The functions are swapped for recording wrappers only while
+    instrumentation is on, so there is no cost at all when it is off.
+
+    Args:
+        callback: Optional function called as callback(stage, seconds, allocated_bytes)
+            after every instrumented call.
+        track_memory: if True, also record allocated bytes using tracemalloc.
+    Returns:
+        The Instrumentation object collecting the measurements.
+    """
+
+    global _instrumentation, _started_tracemalloc
+    disable_instrumentation()
+
+    instrumentation = Instrumentation(callback, track_memory)
+    if track_memory:
+        import tracemalloc
+
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+
+    # Replace each function with a recording wrapper, remembering the original
+    for stage in INSTRUMENTED_STAGES:
+        _uninstrumented[stage] = globals()[stage]
+        globals()[stage] = instrumentation.wrap(stage, _uninstrumented[stage])
+    _instrumentation = instrumentation
+    return instrumentation
+
+def disable_instrumentation():
+    """Stops recording and puts the original functions back.
+
+    Returns:
+        The Instrumentation object that was collecting, or None if it was off.
+    """
+
+    global _instrumentation, _started_tracemalloc
+    instrumentation = _instrumentation
+    globals().update(_uninstrumented)
+    _uninstrumented.clear()
+    if _started_tracemalloc:
+        import tracemalloc
+
+        tracemalloc.stop()
+        _started_tracemalloc = False
+    _instrumentation = None
+    return instrumentation
+
+# The active Instrumentation, if enable_instrumentation has been called
+_instrumentation = None
+
+# The original functions, while they are swapped for recording wrappers
+_uninstrumented = {}
+
+# Whether enable_instrumentation started tracemalloc (and so should stop it)
+_started_tracemalloc = False
+
+#-------------------------------------------------------------------#
+#                      Rolling Window Summaries:                    #
+#-------------------------------------------------------------------#
+
+class WindowSummary(NamedTuple):
+    """The summary of one window of days from rolling_summaries."""
+
+    # Position of the window's first row in the data
+    start: int
+
+    # Number of rows in the window
+    count: int
+
+    # Lowest minimum temperature (Fahrenheit) and the ISO date it occurs on
+    min_temp: float
+    min_date: str
+
+    # Highest maximum temperature (Fahrenheit) and the ISO date it occurs on
+    max_temp: float
+    max_date: str
+
+    # Means of the minimum and maximum temperatures (Fahrenheit)
+    min_mean: float
+    max_mean: float
+
+    def summary(self):
+        """Renders the window exactly as generate_summary would render its rows.
+
+        Returns:
+            A string containing the summary information.
+        """
+
+        return _render_summary(
+            self.count,
+            self.min_temp, self.min_date,
+            self.max_temp, self.max_date,
+            self.min_mean, self.max_mean,
+        )
+
+def rolling_summaries(weather_data, window=7):
+    """Summarises every run of `window` consecutive days in O(1) per day.
+
+    The lowest and highest temperatures are tracked with monotonic deques
+    (ties going to the *last* occurrence, like find_min and find_max) and the
+    means with running totals. For whole-number temperatures, such as those
+    from load_data_from_csv, each window matches generate_summary of that
+    slice exactly.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows, in date order.
+        window: The number of days in each window, e.g. 7 or 30.
+    Returns:
+        A generator of WindowSummary objects, one for each full window.
+    """
+
+    if window < 1:
+        raise ValueError("window must be a positive integer")
+
+    # Candidates for the window's lowest/highest value as (index, value, date),
+    # kept in index order with values rising (lows) or falling (highs)
+    lows = deque()
+    highs = deque()
+
+    # The rows in the current window, for removing them from the totals
+    recent = deque()
+    min_total = max_total = 0.0
+
+    for index, row in enumerate(weather_data):
+        min_value = float(row[1])
+        max_value = float(row[2])
+
+        # A new value beats any older candidate that is no better than it
+        while lows and lows[-1][1] >= min_value:
+            lows.pop()
+        lows.append((index, min_value, row[0]))
+        while highs and highs[-1][1] <= max_value:
+            highs.pop()
+        highs.append((index, max_value, row[0]))
+
+        # Add the new day to the running totals, dropping the day that fell out
+        min_total += min_value
+        max_total += max_value
+        recent.append((min_value, max_value))
+        if len(recent) > window:
+            old_min, old_max = recent.popleft()
+            min_total -= old_min
+            max_total -= old_max
+
+        # Forget candidates that are no longer inside the window
+        start = index - window + 1
+        while lows[0][0] < start:
+            lows.popleft()
+        while highs[0][0] < start:
+            highs.popleft()
+
+        if start >= 0:
+            yield WindowSummary(
+                start, window,
+                lows[0][1], lows[0][2],
+                highs[0][1], highs[0][2],
+                min_total / window, max_total / window,
+            )
+
+#-------------------------------------------------------------------#
+#                        Date-indexed Store:                        #
+#-------------------------------------------------------------------#
+
+def _date_key(moment):
+    """Turns a date, datetime or ISO string into a DateIndex key.
+
+    Keys are local (wall clock) seconds since 1970, so "2021-07-02" means
+    the 2nd of July wherever the station is, just like convert_date.
+
+    Args:
+        moment: A date, datetime or ISO date string.
+    Returns:
+        An int key.
+    """
+
+    if isinstance(moment, str):
+        return _encode_iso_date(moment)[0]
+    if not isinstance(moment, datetime):
+        moment = datetime(moment.year, moment.month, moment.day)
+    return (moment.replace(tzinfo=None) - _EPOCH) // timedelta(seconds=1)
+
+class DateIndex:
+    """Weather rows indexed by date for fast range queries and lookups.
+
+    Every date is parsed once when the index is built (in linear time for
+    data already in date order, as weather files are). Each query is then a
+    binary search, and returns plain rows that can go straight into
+    generate_summary or generate_daily_summary.
+    """
+
+    def __init__(self, weather_data):
+        rows = list(weather_data)
+        keys = _encode_iso_dates([row[0] for row in rows])[0]
+
+        # Sort by date if the rows aren't in order already (keeping ties in file order)
+        if any(map(int.__gt__, keys, keys[1:])):
+            order = sorted(range(len(rows)), key=keys.__getitem__)
+            rows = [rows[position] for position in order]
+            keys = array("q", [keys[position] for position in order])
+
+        # Sorted local seconds since 1970, and the row for each
+        self.keys = keys
+        self.rows = rows
+
+    def between(self, start=None, end=None):
+        """Finds the rows from start up to (but not including) end.
+
+        Args:
+            start: A date, datetime or ISO string, or None to start at the beginning.
+            end: A date, datetime or ISO string, or None to run to the end.
+        Returns:
+            A list of [date, min, max] rows in date order.
+        """
+
+        low = 0 if start is None else bisect_left(self.keys, _date_key(start))
+        high = len(self.keys) if end is None else bisect_left(self.keys, _date_key(end))
+        return self.rows[low:high]
+
+    def on(self, day):
+        """Finds the rows for one (local) calendar day.
+
+        Args:
+            day: A date, datetime or ISO string; only its date part is used.
+        Returns:
+            A list of [date, min, max] rows, empty if there is no data that day.
+        """
+
+        start = _date_key(day) // 86400 * 86400
+        return self.between_keys(start, start + 86400)
+
+    def get(self, moment):
+        """Finds the row for an exact date and time.
+
+        Args:
+            moment: A date, datetime or ISO string.
+        Returns:
+            The last [date, min, max] row with that date and time, or None.
+        """
+
+        key = _date_key(moment)
+        position = bisect_right(self.keys, key)
+        if position and self.keys[position - 1] == key:
+            return self.rows[position - 1]
+        return None
+
+    def between_keys(self, start, end):
+        """Finds the rows whose keys are from start up to (but not including) end.
+
+        Args:
+            start: The first key to include.
+            end: The first key to leave out.
+        Returns:
+            A list of [date, min, max] rows in date order.
+        """
+
+        return self.rows[bisect_left(self.keys, start):bisect_left(self.keys, end)]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+#-------------------------------------------------------------------#
+#                       Summary Result Cache:                       #
+#-------------------------------------------------------------------#
+
+class CacheInfo(NamedTuple):
+    """Hit and miss counts for one part of a SummaryCache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups that were hits (0.0 before any lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class _LRU:
+    """A bounded least-recently-used mapping with hit/miss counts."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+def _write_json(state, path):
+    """Writes JSON through a temporary file so readers never see half of it.
+
+    Args:
+        state: The object to write.
+        path: The path of the JSON file.
+    """
+
+    import json
+
+    temporary_file = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_file, "w", encoding="utf8") as f:
+            json.dump(state, f)
+        os.replace(temporary_file, path)
+    except Exception:
+        # Don't leave a half-written temporary file behind
+        try:
+            os.remove(temporary_file)
+        except OSError:
+            pass
+        raise
+
+class SummaryCache:
+    """Caches generate_summary and generate_daily_summary results.
+
+    Summaries are keyed by a hash of the rows' content, or for files by
+    (path, mtime, size), and evicted least-recently-used first. Daily
+    summaries are cached one day's block at a time, so overlapping date
+    ranges reuse each other's work. The cache can optionally be saved to and
+    reloaded from a JSON file.
+    """
+
+    def __init__(self, maxsize=128, daily_maxsize=65536, path=None):
+        # Whole summaries, keyed by content hash or file identity
+        self.summaries = _LRU(maxsize)
+
+        # Daily summary blocks, keyed by (date, min, max)
+        self.days = _LRU(daily_maxsize)
+
+        # Where save() writes the cache, and where it is loaded from now
+        self.path = path
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    @staticmethod
+    def content_key(weather_data):
+        """Hashes a list of rows into a cache key.
+
+        Args:
+            weather_data: A list of [date, min, max] rows.
+        Returns:
+            A string key that changes whenever any row changes.
+        """
+
+        import hashlib
+
+        return "rows:" + hashlib.blake2b(repr(weather_data).encode("utf8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def file_key(csv_file):
+        """Builds a cache key from a file's path, modification time and size.
+
+        Args:
+            csv_file: a string representing the file path to a csv file.
+        Returns:
+            A string key that changes whenever the file does.
+        """
+
+        source = os.stat(csv_file)
+        return f"file:{os.path.abspath(csv_file)}:{source.st_mtime_ns}:{source.st_size}"
+
+    def summary(self, weather_data):
+        """Returns generate_summary for the rows, computing it only on a miss.
+
+        Args:
+            weather_data: Any iterable of [date, min, max] rows.
+        Returns:
+            A string containing the summary information.
+        """
+
+        if not isinstance(weather_data, list):
+            weather_data = list(weather_data)
+        key = self.content_key(weather_data)
+        result = self.summaries.get(key)
+        if result is None:
+            result = generate_summary(weather_data)
+            self.summaries.put(key, result)
+        return result
+
+    def summary_for_file(self, csv_file):
+        """Returns generate_summary for a csv file without re-reading an unchanged file.
+
+        Args:
+            csv_file: a string representing the file path to a csv file.
+        Returns:
+            A string containing the summary information.
+        """
+
+        key = self.file_key(csv_file)
+        result = self.summaries.get(key)
+        if result is None:
+            result = generate_summary(iter_data_from_csv(csv_file, fast=True))
+            self.summaries.put(key, result)
+        return result
+
+    def daily_summary(self, weather_data):
+        """Returns generate_daily_summary for the rows, reusing cached day blocks.
+
+        Args:
+            weather_data: Any iterable of [date, min, max] rows.
+        Returns:
+            A string containing the summary information.
+        """
+
+        blocks = []
+        missing = []
+        for row in weather_data:
+            key = (row[0], row[1], row[2])
+            block = self.days.get(key)
+            if block is None:
+                missing.append((len(blocks), key, row))
+            blocks.append(block)
+
+        # Build every missing block in one batch
+        new_blocks = iter_daily_summary([row for _, _, row in missing])
+        for (position, key, _), block in zip(missing, new_blocks):
+            blocks[position] = block
+            self.days.put(key, block)
+        return "".join(blocks)
+
+    def info(self):
+        """Reports how well the cache is working.
+
+        Returns:
+            A dict with CacheInfo for "summary" and "daily".
+        """
+
+        return {"summary": self.summaries.info(), "daily": self.days.info()}
+
+    def clear(self):
+        """Empties the cache and resets its counts."""
+
+        self.summaries = _LRU(self.summaries.maxsize)
+        self.days = _LRU(self.days.maxsize)
+
+    def save(self, path=None):
+        """Writes the cached results to a JSON file.
+
+        Args:
+            path: Where to write; defaults to the path given when the cache was made.
+        """
+
+        path = path or self.path
+        if path is None:
+            raise ValueError("no path to save the cache to")
+        state = {
+            "summaries": list(self.summaries.entries.items()),
+            "days": [[list(key), block] for key, block in self.days.entries.items()],
+        }
+        _write_json(state, path)
+
+    def load(self, path):
+        """Adds the results saved in a JSON file to the cache.
+
+        Args:
+            path: A file written by save().
+        """
+
+        import json
+
+        with open(path, encoding="utf8") as f:
+            state = json.load(f)
+        for key, result in state["summaries"]:
+            self.summaries.put(key, result)
+        for key, block in state["days"]:
+            self.days.put(tuple(key), block)
+
+#-------------------------------------------------------------------#
+#                       Compact Row Storage:                        #
+#-------------------------------------------------------------------#
+
+# Array type codes tried, smallest first, for a column of temperatures
+_TEMPERATURE_TYPECODES = ("h", "l", "q", "d")
+
+# Number of rows CompactWeatherData turns back into rows at a time
+_COMPACT_CHUNK_SIZE = 4096
+
+def _compact_column(values, typecode="h"):
+    """Packs numbers into the smallest array type that holds them all.
+
+    Args:
+        values: A list of numbers.
+        typecode: The smallest type code to try.
+    Returns:
+        An array.array.
+    """
+
+    for code in _TEMPERATURE_TYPECODES[_TEMPERATURE_TYPECODES.index(typecode):]:
+        try:
+            return array(code, values)
+        except (OverflowError, TypeError):
+            continue
+    raise TypeError("temperatures must be numbers")
+
+class CompactWeatherData:
+    """Weather rows stored as parallel arrays instead of lists of lists.
+
+    Dates are kept as int64 local seconds since 1970 plus an int32 UTC offset,
+    and temperatures in the smallest array type that holds them (int16 for
+    normal whole-number data): 16 bytes per day, against roughly 150 for a
+    [date, min, max] list. It behaves like a sequence of [date, min, max]
+    rows, so every function in this module accepts it, and find_min,
+    find_max and calculate_mean can be given its min_temps/max_temps columns.
+    """
+
+    def __init__(self):
+        self.dates = array("q")
+        self.utc_offsets = array("i")
+        self.min_temps = array("h")
+        self.max_temps = array("h")
+
+    @classmethod
+    def from_rows(cls, weather_data):
+        """Packs [date, min, max] rows into compact storage.
+
+        Args:
+            weather_data: Any iterable of rows, e.g. from iter_data_from_csv.
+        Returns:
+            A CompactWeatherData holding the same rows.
+        """
+
+        compact = cls()
+        for rows in _chunks(weather_data, _COMPACT_CHUNK_SIZE):
+            compact.extend(rows)
+        return compact
+
+    def extend(self, weather_data):
+        """Adds rows to the end of the storage.
+
+        Args:
+            weather_data: A list of [date, min, max] rows.
+        """
+
+        iso_dates = [row[0] for row in weather_data]
+        dates, offsets = _encode_iso_dates(iso_dates)
+
+        # Only dates that come back exactly the same can be stored this way
+        if _decode_iso_dates(dates, offsets) != iso_dates:
+            raise ValueError("CompactWeatherData needs ISO dates without fractional seconds")
+
+        min_temps = [row[1] for row in weather_data]
+        max_temps = [row[2] for row in weather_data]
+        self.min_temps = self._grow(self.min_temps, min_temps)
+        self.max_temps = self._grow(self.max_temps, max_temps)
+        self.dates.extend(dates)
+        self.utc_offsets.extend(offsets)
+
+    def append(self, row):
+        """Adds a single [date, min, max] row to the end of the storage.
+
+        Args:
+            row: A list representing a day of weather data.
+        """
+
+        self.extend([row])
+
+    @staticmethod
+    def _grow(column, values):
+        """Appends values to a column, widening its type if they don't fit.
+
+        Args:
+            column: An array.array.
+            values: A list of numbers.
+        Returns:
+            The column (a new, wider one if needed).
+        """
+
+        new_values = _compact_column(values, column.typecode)
+        if new_values.typecode != column.typecode:
+            column = array(new_values.typecode, column)
+        column.extend(new_values)
+        return column
+
+    def summary_accumulator(self):
+        """Summarises the columns directly, without building any rows.
+
+        Returns:
+            A SummaryAccumulator equal to one fed every row in order.
+        """
+
+        accumulator = SummaryAccumulator()
+        count = len(self)
+        if not count:
+            return accumulator
+
+        # The *last* lowest/highest value wins, so search from the end
+        min_temp, max_temp = min(self.min_temps), max(self.max_temps)
+        accumulator.min_index = count - 1 - self.min_temps[::-1].index(min_temp)
+        accumulator.max_index = count - 1 - self.max_temps[::-1].index(max_temp)
+        accumulator.min_temp, accumulator.max_temp = float(min_temp), float(max_temp)
+        accumulator.min_date = self[accumulator.min_index][0]
+        accumulator.max_date = self[accumulator.max_index][0]
+
+        # Whole numbers sum exactly, as they would one by one; floats are added in order
+        for total, column in (("min_total", self.min_temps), ("max_total", self.max_temps)):
+            if column.typecode == "d":
+                value = 0.0
+                for temp in column:
+                    value += temp
+            else:
+                value = float(sum(column))
+            setattr(accumulator, total, value)
+        accumulator.count = count
+        return accumulator
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        date = _decode_iso_dates(self.dates[index:index + 1 or None], self.utc_offsets[index:index + 1 or None])[0]
+        return [date, self.min_temps[index], self.max_temps[index]]
+
+    def __iter__(self):
+        # Rebuild rows a chunk at a time so only one chunk of date strings exists at once
+        for start in range(0, len(self), _COMPACT_CHUNK_SIZE):
+            end = start + _COMPACT_CHUNK_SIZE
+            dates = _decode_iso_dates(self.dates[start:end], self.utc_offsets[start:end])
+            for date, min_temp, max_temp in zip(dates, self.min_temps[start:end], self.max_temps[start:end]):
+                yield [date, min_temp, max_temp]
+
+def _chunks(weather_data, size):
+    """Splits any iterable of rows into lists of up to size rows.
+
+    Args:
+        weather_data: Any iterable.
+        size: The largest number of rows per list.
+    Returns:
+        A generator of lists.
+    """
+
+    rows = iter(weather_data)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+#-------------------------------------------------------------------#
+#                          Lazy Summary:                            #
+#-------------------------------------------------------------------#
+
+class LazySummary:
+    """A summary whose statistics are only worked out when first asked for.
+
+    Each field is computed on first access and then remembered, so a caller
+    that only wants the highest temperature never pays for the averages or
+    for formatting the other date. str() gives exactly generate_summary's text.
+    """
+
+    def __init__(self, weather_data):
+        # The rows being summarised (kept as a list, as fields may need several passes)
+        self.weather_data = weather_data if isinstance(weather_data, list) else list(weather_data)
+
+    @property
+    def count(self):
+        """The number of days being summarised."""
+        return len(self.weather_data)
+
+    @cached_property
+    def _min_temps(self):
+        return [row[1] for row in self.weather_data]
+
+    @cached_property
+    def _max_temps(self):
+        return [row[2] for row in self.weather_data]
+
+    @cached_property
+    def _lowest(self):
+        # The lowest minimum (Fahrenheit) and its row index, or () with no data
+        return find_min(self._min_temps)
+
+    @cached_property
+    def _highest(self):
+        # The highest maximum (Fahrenheit) and its row index, or () with no data
+        return find_max(self._max_temps)
+
+    @cached_property
+    def lowest(self):
+        """The lowest temperature in degrees Celcius (0.0 with no data)."""
+        return convert_f_to_c(self._lowest[0]) if self._lowest else 0.0
+
+    @cached_property
+    def lowest_date(self):
+        """The readable date of the lowest temperature ("" with no data)."""
+        return convert_date(self.weather_data[self._lowest[1]][0]) if self._lowest else ""
+
+    @cached_property
+    def highest(self):
+        """The highest temperature in degrees Celcius (0.0 with no data)."""
+        return convert_f_to_c(self._highest[0]) if self._highest else 0.0
+
+    @cached_property
+    def highest_date(self):
+        """The readable date of the highest temperature ("" with no data)."""
+        return convert_date(self.weather_data[self._highest[1]][0]) if self._highest else ""
+
+    @cached_property
+    def average_low(self):
+        """The average low in degrees Celcius, rounded to 1 decimal place."""
+        return round(convert_f_to_c(calculate_mean(self._min_temps)), 1) if self.weather_data else 0.0
+
+    @cached_property
+    def average_high(self):
+        """The average high in degrees Celcius, rounded to 1 decimal place."""
+        return round(convert_f_to_c(calculate_mean(self._max_temps)), 1) if self.weather_data else 0.0
+
+    def __str__(self):
+        if not self.weather_data:
+            return _render_summary(0, None, None, None, None, None, None)
+        return (
+            f"{self.count} Day Overview\n"
+            f"  The lowest temperature will be {format_temperature(self.lowest)}, and will occur on {self.lowest_date}.\n"
+            f"  The highest temperature will be {format_temperature(self.highest)}, and will occur on {self.highest_date}.\n"
+            f"  The average low this week is {format_temperature(self.average_low)}.\n"
+            f"  The average high this week is {format_temperature(self.average_high)}.\n"
+        )
+
+#-------------------------------------------------------------------#
+#                      Incremental Append Mode:                     #
+#-------------------------------------------------------------------#
+
+# Bytes at the start of the file and just before the read position that are
+# checked to make sure already-summarised data hasn't been rewritten
+_FINGERPRINT_SIZE = 4096
+
+class IncrementalSummary:
+    """Keeps a summary of a csv file up to date as rows are appended to it.
+
+    Each update only reads and parses the bytes added since the last one,
+    feeding them into a SummaryAccumulator. If the file has been truncated,
+    replaced or rewritten, the summary is rebuilt from scratch. The state can
+    be saved to a JSON file so that separate runs (e.g. an hourly cron job)
+    pick up where the last one stopped.
+    """
+
+    def __init__(self, csv_file, state_file=None):
+        # The csv file being followed and where its state is saved (if anywhere)
+        self.csv_file = csv_file
+        self.state_file = state_file
+
+        # Whether the most recent update had to start again from the beginning
+        self.rebuilt = False
+
+        self._reset()
+        if state_file is not None and os.path.exists(state_file):
+            import json
+
+            with open(state_file, encoding="utf8") as f:
+                state = json.load(f)
+            self.offset = state["offset"]
+            self.inode = state["inode"]
+            self.fingerprint = state["fingerprint"]
+            self.accumulator = SummaryAccumulator.from_dict(state["accumulator"])
+
+    def _reset(self):
+        # How many bytes of the file have been summarised
+        self.offset = 0
+
+        # The file's inode, to notice it being replaced
+        self.inode = None
+
+        # Hashes of the start of the file and of the bytes just before offset
+        self.fingerprint = None
+
+        # The summary of everything up to offset
+        self.accumulator = SummaryAccumulator()
+
+    def _fingerprint(self, f, offset):
+        """Hashes the start of the file and the bytes just before offset.
+
+        Args:
+            f: The csv file, opened in binary mode.
+            offset: The position summarised up to.
+        Returns:
+            A list of two hex digests.
+        """
+
+        import hashlib
+
+        digests = []
+        for start in (0, max(offset - _FINGERPRINT_SIZE, 0)):
+            f.seek(start)
+            data = f.read(min(_FINGERPRINT_SIZE, offset - start))
+            digests.append(hashlib.blake2b(data, digest_size=16).hexdigest())
+        return digests
+
+    def update(self):
+        """Summarises any complete rows added since the last update.
+
+        Returns:
+            The number of new rows (all rows, after a rebuild).
+        """
+
+        with open(self.csv_file, "rb") as f:
+            source = os.fstat(f.fileno())
+
+            # Start again if the file shrank, was replaced or its old contents changed
+            self.rebuilt = (
+                self.offset > source.st_size
+                or (self.inode is not None and self.inode != source.st_ino)
+                or (self.offset and self._fingerprint(f, self.offset) != self.fingerprint)
+            )
+            if self.rebuilt:
+                self._reset()
+
+            # Only complete lines are parsed; a half-written last line waits for next time
+            f.seek(self.offset)
+            new_data = f.read()
+            end = new_data.rfind(b"\n") + 1
+            rows = self._parse(new_data[:end].decode("utf8"), first=not self.offset)
+            self.accumulator.update(rows)
+
+            self.offset += end
+            self.inode = source.st_ino
+            self.fingerprint = self._fingerprint(f, self.offset)
+
+        if self.state_file is not None:
+            self.save()
+        return len(rows)
+
+    @staticmethod
+    def _parse(text, first):
+        """Parses newly added csv text into rows.
+
+        Args:
+            text: Complete csv lines.
+            first: Whether the text starts at the beginning of the file (and so may have a header).
+        Returns:
+            A list of [date, min, max] rows.
+        """
+
+        text = text.replace("\r\n", "\n").rstrip("\n")
+        if not text:
+            return []
+        if first:
+            first_line, _, rest = text.partition("\n")
+            header = next(csv.reader([first_line]), None)
+            if header and _is_header(header):
+                text = rest
+                if not text:
+                    return []
+        return _parse_csv_block(text)
+
+    def summary(self):
+        """Renders the summary of everything read so far.
+
+        Returns:
+            The same text generate_summary gives for the file.
+        """
+
+        return self.accumulator.summary()
+
+    def save(self, state_file=None):
+        """Writes the read position and summary state to a JSON file.
+
+        Args:
+            state_file: Where to write; defaults to the state file given when created.
+        """
+
+        state_file = state_file or self.state_file
+        if state_file is None:
+            raise ValueError("no state file to save to")
+        state = {
+            "offset": self.offset,
+            "inode": self.inode,
+            "fingerprint": self.fingerprint,
+            "accumulator": self.accumulator.to_dict(),
+        }
+        _write_json(state, state_file)
+
+#-------------------------------------------------------------------#
+#                    Multi-Station Summaries:                       #
+#-------------------------------------------------------------------#
+
+# Column order assumed for a station file without a header
+STATION_COLUMNS = ("station", "date", "min", "max")
+
+def _station_columns(row):
+    """Works out where each column is from a station file's header row.
+
+    Args:
+        row: The first row read from the csv file.
+    Returns:
+        A tuple of the station, date, min and max column positions, or None if
+        the row isn't a header.
+    """
+
+    names = [cell.strip().lower() for cell in row]
+    if sorted(names) != sorted(STATION_COLUMNS):
+        return None
+    return tuple(names.index(name) for name in STATION_COLUMNS)
+
+def iter_station_rows(csv_file):
+    """Reads a long-format csv file that has a station column.
+
+    The header may list station, date, min and max in any order; without a
+    header the columns are taken to be station,date,min,max.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A generator of (station, [date, min, max]) pairs.
+    """
+
+    with open(csv_file, "r", newline="") as f:
+        reader = csv.reader(f)
+
+        # The first line may be a header giving the column order
+        first = next(reader, None)
+        if first is None:
+            return
+        columns = _station_columns(first)
+        if columns is None:
+            columns = tuple(range(len(STATION_COLUMNS)))
+            reader = chain([first], reader)
+        station_column, date_column, min_column, max_column = columns
+
+        for row in reader:
+            # Skip blank or empty rows
+            if not row or not any(cell.strip() for cell in row):
+                continue
+
+            yield row[station_column].strip(), _parse_row((row[date_column], row[min_column], row[max_column]))
+
+def group_by_station(csv_file, compact=True):
+    """Reads a station csv file in one pass and splits its rows by station.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        compact: if True, each station's rows go into a CompactWeatherData
+            (columnar arrays); if False, into a plain list of rows. Compact
+            storage raises ValueError for dates it can't store exactly (e.g.
+            without seconds or with fractions of a second); use compact=False
+            or summarise_stations for those.
+    Returns:
+        A dict mapping each station (in the order first seen) to its rows.
+    """
+
+    if not compact:
+        stations = {}
+        for station, row in iter_station_rows(csv_file):
+            stations.setdefault(station, []).append(row)
+        return stations
+
+    # Rows are gathered per station and packed into the arrays a chunk at a time
+    stations = {}
+    pending = {}
+    for station, row in iter_station_rows(csv_file):
+        rows = pending.get(station)
+        if rows is None:
+            stations[station] = CompactWeatherData()
+            rows = pending[station] = []
+        rows.append(row)
+        if len(rows) == _COMPACT_CHUNK_SIZE:
+            stations[station].extend(rows)
+            rows.clear()
+    for station, rows in pending.items():
+        if rows:
+            stations[station].extend(rows)
+    return stations
+
+def summarise_stations(csv_file):
+    """Builds a generate_summary report for every station in a csv file.
+
+    Rows are streamed into one SummaryAccumulator per station, so memory
+    grows with the number of stations rather than the number of rows.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A dict mapping each station (in the order first seen) to its summary text.
+    """
+
+    accumulators = {}
+    for station, row in iter_station_rows(csv_file):
+        accumulator = accumulators.get(station)
+        if accumulator is None:
+            accumulator = accumulators[station] = SummaryAccumulator()
+        accumulator.add(row)
+    return {station: accumulator.summary() for station, accumulator in accumulators.items()}
+
+#-------------------------------------------------------------------#
+#                     Parallel Single-File Parser:                  #
+#-------------------------------------------------------------------#
+
+# Smallest piece of a file worth handing to a separate worker
+PARALLEL_CHUNK_SIZE = 8 << 20
+
+# Pieces per worker, so a slow piece doesn't leave the other workers idle
+_CHUNKS_PER_WORKER = 4
+
+def _split_csv_file(csv_file, parts):
+    """Splits a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        parts: roughly how many ranges to make.
+    Returns:
+        A list of (start, end) byte offsets covering the whole file in order.
+    """
+
+    size = os.path.getsize(csv_file)
+    boundaries = [0]
+    with open(csv_file, "rb") as f:
+        for part in range(1, parts):
+            # Move each cut forward to just after the next newline
+            position = max(size * part // parts, boundaries[-1])
+            f.seek(position)
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+def _parse_csv_range(csv_file, start, end):
+    """Parses the complete lines between two byte offsets of a csv file.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        start: the offset of the first byte, at the start of a line.
+        end: the offset just past the last byte, at the end of a line.
+    Returns:
+        A list of [date, min, max] rows.
+    """
+
+    with open(csv_file, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Turn the line endings into "\n", as reading in text mode would
+    text = data.decode("utf8").replace("\r\n", "\n").replace("\r", "\n").rstrip("\n")
+
+    # Only the piece at the very start of the file can have the header
+    if start == 0:
+        first_line, _, rest = text.partition("\n")
+        header = next(csv.reader([first_line]), None)
+        if header and _is_header(header):
+            text = rest
+    if not text:
+        return []
+    return _parse_csv_block(text)
+
+def _free_threaded():
+    """Checks whether Python is running without the GIL (3.13+ free-threaded builds).
+
+    Returns:
+        True if threads can run Python code in parallel.
+    """
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+def load_data_parallel(csv_file, max_workers=None, chunk_size=PARALLEL_CHUNK_SIZE):
+    """Reads one large csv file by parsing pieces of it in parallel.
+
+    The file is cut at newlines into pieces that are parsed by worker
+    processes (or threads on a free-threaded Python) and put back together
+    in order. Gives exactly the same rows as load_data_from_csv.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        max_workers: the number of workers. None uses one per CPU and 1 parses
+            the whole file in the current process.
+        chunk_size: the smallest piece, in bytes, given to a worker.
+    Returns:
+        A list of [date, min, max] rows.
+    """
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    # Make enough pieces to keep every worker busy, but none smaller than chunk_size
+    size = os.path.getsize(csv_file)
+    parts = max(1, min(max_workers * _CHUNKS_PER_WORKER, size // max(chunk_size, 1)))
+    ranges = _split_csv_file(csv_file, parts)
+
+    # Small files (or a single worker) aren't worth the cost of a pool
+    if max_workers == 1 or len(ranges) == 1:
+        pieces = [_parse_csv_range(csv_file, start, end) for start, end in ranges]
+    else:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        executor_class = ThreadPoolExecutor if _free_threaded() else ProcessPoolExecutor
+        with executor_class(max_workers=min(max_workers, len(ranges))) as executor:
+            pieces = list(executor.map(
+                _parse_csv_range,
+                [csv_file] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            ))
+
+    # Stitch the pieces back together in file order
+    data = []
+    for rows in pieces:
+        data.extend(rows)
+    return data
+
+#-------------------------------------------------------------------#
+#                     Arrow and Parquet Files:                      #
+#-------------------------------------------------------------------#
+
+# Rows per Parquet row group; smaller groups let date filters skip more of the file
+PARQUET_ROW_GROUP_SIZE = 1 << 16
+
+def _import_pyarrow():
+    """Imports pyarrow on first use so the rest of the module works without it.
+
+    Returns:
+        The pyarrow module.
+    """
+
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("pyarrow is required for Arrow and Parquet files") from error
+    return pyarrow
+
+def _date_filter(start, end):
+    """Builds the pyarrow filter expression for a date range.
+
+    Rows are compared on their wall clock time in seconds, exactly like
+    DateIndex keys, so "2021-07-01" and "2021-07-01T00:00:00+08:00" are the
+    same moment and a bound given as a date or datetime works the same way
+    as its ISO string. A plain string comparison on the day is added as well,
+    which Parquet can check against each row group's statistics to skip
+    groups outside the range.
+
+    Args:
+        start: The first date to include (date, datetime or ISO string), or None.
+        end: The first date to leave out, or None.
+    Returns:
+        A pyarrow.compute.Expression, or None if there is no range.
+    """
+
+    pyarrow = _import_pyarrow()
+    import pyarrow.compute as compute
+
+    # Each row's wall clock time: the date string without its UTC offset
+    date = compute.field("date")
+    wall_clock = compute.replace_substring_regex(date, pattern=r"(Z|[+-]\d\d:?\d\d)$", replacement="")
+    seconds = wall_clock.cast(pyarrow.timestamp("us")).cast(pyarrow.timestamp("s"), safe=False)
+
+    expression = None
+    if start is not None:
+        key = _date_key(start)
+        first_day = (_EPOCH + timedelta(seconds=key)).date()
+        expression = (date >= first_day.isoformat()) & (seconds >= pyarrow.scalar(key, pyarrow.timestamp("s")))
+    if end is not None:
+        key = _date_key(end)
+        day_after = (_EPOCH + timedelta(seconds=key)).date() + timedelta(days=1)
+        before_end = (date < day_after.isoformat()) & (seconds < pyarrow.scalar(key, pyarrow.timestamp("s")))
+        expression = before_end if expression is None else expression & before_end
+    return expression
+
+def _arrow_table(weather_data):
+    """Builds a date/min/max pyarrow Table from weather rows.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows, or an ArrowWeatherData.
+    Returns:
+        A pyarrow.Table with a string date column and numeric min and max columns.
+    """
+
+    pyarrow = _import_pyarrow()
+    if isinstance(weather_data, ArrowWeatherData):
+        return weather_data.table
+
+    rows = weather_data if isinstance(weather_data, (list, CompactWeatherData)) else list(weather_data)
+    return pyarrow.table({
+        "date": pyarrow.array([row[0] for row in rows], type=pyarrow.string()),
+        "min": pyarrow.array([row[1] for row in rows]),
+        "max": pyarrow.array([row[2] for row in rows]),
+    })
+
+class ArrowWeatherData:
+    """Weather rows held in a pyarrow Table.
+
+    Iterating gives the same [date, min, max] rows as load_data_from_csv, so
+    it can be passed to generate_summary and generate_daily_summary. The
+    min_temps and max_temps columns are NumPy arrays for find_min, find_max
+    and calculate_mean; for a file from write_arrow they are views of the
+    memory-mapped Arrow buffers, with nothing copied.
+    """
+
+    def __init__(self, table):
+        # The underlying pyarrow.Table with date, min and max columns
+        self.table = table.select(["date", "min", "max"])
+
+    @cached_property
+    def min_temps(self):
+        return _column_array(self.table.column("min"))
+
+    @cached_property
+    def max_temps(self):
+        return _column_array(self.table.column("max"))
+
+    def iso_dates(self):
+        """Gets the ISO date strings for every row.
+
+        Returns:
+            A list of ISO date strings.
+        """
+
+        return self.table.column("date").to_pylist()
+
+    def __len__(self):
+        return self.table.num_rows
+
+    def __iter__(self):
+        # Convert one record batch at a time rather than the whole table at once
+        for batch in self.table.to_batches():
+            columns = [column.to_pylist() for column in batch.columns]
+            yield from map(list, zip(*columns))
+
+def _column_array(column):
+    """Views a numeric Arrow column as a NumPy array.
+
+    Args:
+        column: A pyarrow.ChunkedArray with no nulls.
+    Returns:
+        A NumPy array, sharing the Arrow buffer when the column is one chunk.
+    """
+
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+def write_arrow(weather_data, arrow_file):
+    """Writes weather rows to an Arrow IPC file.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows.
+        arrow_file: The path of the file to write.
+    Returns:
+        The number of rows written.
+    """
+
+    pyarrow = _import_pyarrow()
+    table = _arrow_table(weather_data)
+
+    # One record batch keeps every column in a single chunk, so reads are zero-copy
+    with pyarrow.OSFile(arrow_file, "wb") as sink:
+        with pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+    return table.num_rows
+
+def load_data_from_arrow(arrow_file, start=None, end=None):
+    """Reads weather rows from an Arrow IPC file without copying them.
+
+    The file is memory-mapped, so only the pages actually used are read.
+
+    Args:
+        arrow_file: The path of an Arrow IPC file with date, min and max columns.
+        start: The first date to include (date, datetime or ISO string), or None.
+        end: The first date to leave out, or None.
+    Returns:
+        An ArrowWeatherData.
+    """
+
+    pyarrow = _import_pyarrow()
+    table = pyarrow.ipc.open_file(pyarrow.memory_map(arrow_file, "r")).read_all()
+    expression = _date_filter(start, end)
+    if expression is not None:
+        table = table.filter(expression)
+    return ArrowWeatherData(table)
+
+def write_parquet(weather_data, parquet_file, row_group_size=PARQUET_ROW_GROUP_SIZE):
+    """Writes weather rows to a Parquet file.
+
+    Args:
+        weather_data: Any iterable of [date, min, max] rows.
+        parquet_file: The path of the file to write.
+        row_group_size: The number of rows in each row group.
+    Returns:
+        The number of rows written.
+    """
+
+    _import_pyarrow()
+    import pyarrow.parquet as parquet
+
+    table = _arrow_table(weather_data)
+    parquet.write_table(table, parquet_file, row_group_size=row_group_size)
+    return table.num_rows
+
+def load_data_from_parquet(parquet_file, start=None, end=None):
+    """Reads weather rows from a Parquet file.
+
+    A date range is pushed down to the reader, so row groups whose date
+    statistics fall outside it are never read or decoded.
+
+    Args:
+        parquet_file: The path of a Parquet file with date, min and max columns.
+        start: The first date to include (date, datetime or ISO string), or None.
+        end: The first date to leave out, or None.
+    Returns:
+        An ArrowWeatherData.
+    """
+
+    _import_pyarrow()
+    import pyarrow.parquet as parquet
+
+    table = parquet.read_table(
+        parquet_file,
+        columns=["date", "min", "max"],
+        filters=_date_filter(start, end),
+        memory_map=True,
+    )
+    return ArrowWeatherData(table)
+
+#-------------------------------------------------------------------#
+#                        Validating Ingestion:                      #
+#-------------------------------------------------------------------#
+
+# Lowest and highest believable temperatures (Fahrenheit), just past the world records
+PLAUSIBLE_TEMPERATURE_RANGE = (-130, 140)
+
+# Most bad rows validate_csv keeps the details of (every one is still counted)
+MAX_REPORTED_ERRORS = 1000
+
+class RowError(NamedTuple):
+    """A csv line that failed validation."""
+
+    # The line number in the file (the first line is 1)
+    line: int
+
+    # The text of the line
+    text: str
+
+    # What is wrong with it
+    message: str
+
+class ValidationReport(NamedTuple):
+    """The outcome of validate_csv."""
+
+    # Every valid [date, min, max] row, in file order
+    rows: list
+
+    # Details of the first MAX_REPORTED_ERRORS bad lines
+    errors: list
+
+    # How many bad lines there were in total
+    error_count: int
+
+    # How long the file took to read and check, in seconds
+    seconds: float
+
+    @property
+    def rows_per_second(self):
+        """Rows (good and bad) checked per second."""
+        checked = len(self.rows) + self.error_count
+        return checked / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        lines = [
+            f"{len(self.rows) + self.error_count} rows checked in {self.seconds:.3f}s "
+            f"({self.rows_per_second:,.0f} rows/s): {len(self.rows)} valid, {self.error_count} invalid\n"
+        ]
+        for error in self.errors:
+            lines.append(f"  line {error.line}: {error.message}: {error.text}\n")
+        if self.error_count > len(self.errors):
+            lines.append(f"  ... and {self.error_count - len(self.errors)} more\n")
+        return "".join(lines)
+
+def validate_csv(csv_file, temperature_range=PLAUSIBLE_TEMPERATURE_RANGE,
+                 max_errors=MAX_REPORTED_ERRORS, block_size=CSV_BLOCK_SIZE):
+    """Reads a csv file, checking every row instead of stopping at the first bad one.
+
+    Each row needs an ISO date convert_date understands, numeric min and max
+    values and temperatures inside temperature_range. Blocks of lines are
+    checked column by column, and only a block containing a bad line is
+    gone through line by line to find it, so checking costs little more
+    than load_data_from_csv(csv_file, fast=True).
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        temperature_range: the (lowest, highest) plausible temperature in Fahrenheit.
+        max_errors: how many bad lines to keep the details of.
+        block_size: roughly how many characters to read at a time.
+    Returns:
+        A ValidationReport with the valid rows and the bad lines.
+    """
+
+    start = time.perf_counter()
+    rows = []
+    errors = []
+    error_count = 0
+
+    with open(csv_file, "r") as f:
+        leftover = ""
+        line_number = 1
+        first_block = True
+        while True:
+            text = f.read(block_size)
+
+            # Only check up to the last complete line and keep the rest for later
+            if text:
+                text = leftover + text
+                end = text.rfind("\n")
+                if end < 0:
+                    leftover = text
+                    continue
+                block, leftover = text[:end], text[end + 1:]
+            elif leftover:
+                block, leftover = leftover, ""
+            else:
+                break
+
+            block_line_number = line_number
+            line_number += block.count("\n") + 1
+
+            # The first line of the file may be a header
+            if first_block:
+                first_block = False
+                first_line, newline, rest = block.partition("\n")
+                header = next(csv.reader([first_line]), None)
+                if header and _is_header(header):
+                    block = rest
+                    block_line_number += 1
+                    if not newline:
+                        continue
+
+            block_rows, block_errors = _validate_block(block, block_line_number, temperature_range)
+            rows.extend(block_rows)
+            error_count += len(block_errors)
+            errors.extend(block_errors[:max(max_errors - len(errors), 0)])
+
+    return ValidationReport(rows, errors, error_count, time.perf_counter() - start)
+
+def _validate_block(text, first_line_number, temperature_range):
+    """Checks a block of complete csv lines.
+
+    Args:
+        text: Complete lines from the csv file, separated by newlines.
+        first_line_number: The line number of the first line in the block.
+        temperature_range: The (lowest, highest) plausible temperature in Fahrenheit.
+    Returns:
+        A tuple of the valid [date, min, max] rows and a list of RowErrors.
+    """
+
+    lowest, highest = temperature_range
+
+    # Check a plain three-column block a whole column at a time
+    if _is_three_column_block(text):
+        cells = text.replace("\n", ",").split(",")
+        try:
+            min_temps = _parse_int_column(cells[1::3])
+            max_temps = _parse_int_column(cells[2::3])
+            dates = [date.strip() for date in cells[0::3]]
+            deque(map(datetime.fromisoformat, dates), maxlen=0)
+        except (ValueError, OverflowError):
+            # Something in the block is bad (including inf): find it line by line below
+            pass
+        else:
+            if (
+                min(min(min_temps), min(max_temps)) >= lowest
+                and max(max(min_temps), max(max_temps)) <= highest
+            ):
+                return list(map(list, zip(dates, min_temps, max_temps))), []
+
+    rows = []
+    errors = []
+    for line_number, line in enumerate(text.split("\n"), first_line_number):
+        # Skip blank lines, as load_data_from_csv does
+        if not line.strip(" ,\t\r"):
+            continue
+        row, message = _validate_line(line, temperature_range)
+        if message is None:
+            rows.append(row)
+        else:
+            errors.append(RowError(line_number, line, message))
+    return rows, errors
+
+def _validate_line(line, temperature_range):
+    """Checks a single csv line.
+
+    Args:
+        line: The text of the line.
+        temperature_range: The (lowest, highest) plausible temperature in Fahrenheit.
+    Returns:
+        A tuple of the [date, min, max] row and None, or None and what is wrong.
+    """
+
+    cells = next(csv.reader([line]), [])
+    if len(cells) != 3:
+        return None, f"expected 3 columns, found {len(cells)}"
+
+    date = cells[0].strip()
+    try:
+        datetime.fromisoformat(date)
+    except ValueError:
+        return None, f"invalid date {date!r}"
+
+    temps = []
+    for name, cell in (("min", cells[1]), ("max", cells[2])):
+        try:
+            temp = int(float(cell))
+        except (ValueError, OverflowError):
+            return None, f"{name} is not a number: {cell.strip()!r}"
+        if not temperature_range[0] <= temp <= temperature_range[1]:
+            return None, f"{name} temperature {temp} is outside {temperature_range[0]} to {temperature_range[1]}"
+        temps.append(temp)
+
+    return [date, *temps], None
+
+#-------------------------------------------------------------------#
+#                          Command Line:                            #
+#-------------------------------------------------------------------#
+
+def main(argv=None):
+    """Runs the weather command line, e.g. python -m weather summary station.csv.
+
+    Subcommands:
+        summary CSV       print generate_summary for a file
+        daily CSV         print (or write with -o) the daily summary for a file
+        batch CSV...      print the summary of every file, in parallel
+        validate CSV      check every row of a file and list the bad ones
+
+    Args:
+        argv: The command line arguments; sys.argv[1:] by default.
+    Returns:
+        The exit status: 0 on success, 1 if any file failed or had bad rows.
+    """
+
+    # argparse is only needed when run as a command, so don't slow down imports with it
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m weather", description="Summarise weather csv files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    summary_parser = commands.add_parser("summary", help="print the overall summary of a csv file")
+    summary_parser.add_argument("csv_file")
+
+    daily_parser = commands.add_parser("daily", help="print the daily summary of a csv file")
+    daily_parser.add_argument("csv_file")
+    daily_parser.add_argument("-o", "--output", help="write to this file instead of standard output")
+
+    batch_parser = commands.add_parser("batch", help="print the summary of many csv files")
+    batch_parser.add_argument("csv_files", nargs="+", help="csv files or glob patterns")
+    batch_parser.add_argument("-j", "--workers", type=_positive_int, help="worker processes (default: one per CPU)")
+
+    validate_parser = commands.add_parser("validate", help="check every row of a csv file and list the bad ones")
+    validate_parser.add_argument("csv_file")
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "validate":
+            report = validate_csv(args.csv_file)
+            sys.stdout.write(str(report))
+            return 1 if report.error_count else 0
+        if args.command == "batch":
+            return _run_batch(args.csv_files, args.workers)
+        rows = iter_data_from_csv(args.csv_file, fast=True)
+        if args.command == "summary":
+            sys.stdout.write(generate_summary(rows))
+        elif args.output is None:
+            write_daily_summary(rows, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf8") as output_file:
+                write_daily_summary(rows, output_file)
+    except (OSError, ValueError, IndexError) as error:
+        if isinstance(error, BrokenPipeError):
+            # Whatever was reading the output (e.g. head) has stopped; finish quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 0
+        # Batch problems with a particular file are reported by _run_batch, so
+        # anything reaching here is about the batch as a whole
+        source = "batch" if args.command == "batch" else args.csv_file
+        print(f"{source}: {type(error).__name__}: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+def _positive_int(text):
+    """Parses a command line option that must be a whole number of at least 1.
+
+    Args:
+        text: The option's value.
+    Returns:
+        The value as an int.
+    """
+
+    import argparse
+
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {text!r}")
+    return value
+
+def _run_batch(patterns, max_workers):
+    """Prints the summary of every file for the batch subcommand.
+
+    Args:
+        patterns: csv file paths or glob patterns, in the order given.
+        max_workers: the number of worker processes, or None for one per CPU.
+    Returns:
+        The exit status: 0 if every file was summarised, otherwise 1.
+    """
 
-    # Return the completed daily summary
-    return daily_summary
\ No newline at end of file
+    # Expand any patterns the shell didn't, keeping the files in the order given
+    csv_files = []
+    for pattern in patterns:
+        csv_files.extend(sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern])
+
+    failed = False
+    for result in summarise_files(csv_files, max_workers=max_workers):
+        if result.error is not None:
+            print(f"{result.path}: {result.error}", file=sys.stderr)
+            failed = True
+        else:
+            sys.stdout.write(f"==== {result.path} ====\n{result.summary}\n")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""A small asyncio HTTP service that serves weather summaries.
+
+Parsed datasets are kept warm in memory between requests, so a request only
+pays for the summary itself. Run it with:
+
+    python weather_service.py --port 8000 --root /path/to/csv/files
+
+and ask for summaries with:
+
+    GET /summary?path=station.csv&start=2021-07-01&end=2021-08-01
+    GET /daily?path=station.csv&start=2021-07-01&end=2021-08-01
+
+start and end are optional and the range includes start but not end.
+"""
+
+import argparse
+import asyncio
+import os
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+import weather
+
+# Longest request line or header line the service will read
+MAX_LINE_LENGTH = 8192
+
+# Most parsed csv files kept in memory at once
+MAX_DATASETS = 16
+
+
+class RequestError(Exception):
+    """A request that can't be served, with the HTTP status to reply with."""
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class WeatherService:
+    """Keeps parsed csv files in memory and builds summaries from them.
+
+    Only csv files inside the root directory can be requested. Datasets are
+    reloaded when their file's modification time or size changes, the least
+    recently used are dropped once more than max_datasets are loaded, and
+    concurrent requests for the same file share a single load. Loading and
+    summarising run in an executor so the event loop stays free.
+    """
+
+    def __init__(self, root=None, executor=None, max_datasets=MAX_DATASETS):
+        # Only csv files inside this directory may be read (the current directory by default)
+        self.root = os.path.realpath(root if root is not None else os.getcwd())
+
+        # The concurrent.futures executor for CPU-bound work (None uses asyncio's default)
+        self.executor = executor
+
+        # Path -> ((mtime_ns, size), DateIndex) for the loaded files, least recently used first
+        self.datasets = OrderedDict()
+        self.max_datasets = max_datasets
+
+        # (path, (mtime_ns, size)) -> the task loading it, while it loads
+        self.loading = {}
+
+        # How many times a file has actually been parsed
+        self.loads = 0
+
+    def resolve(self, path):
+        """Checks a requested path and turns it into a real file path.
+
+        Args:
+            path: The path given in the request.
+        Returns:
+            The absolute path of the csv file.
+        """
+
+        if not path:
+            raise RequestError(400, "missing path parameter")
+        path = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise RequestError(403, "path is outside the service root")
+        if not os.path.isfile(path):
+            raise RequestError(404, "no such file")
+        return path
+
+    async def dataset(self, path):
+        """Gets the DateIndex for a csv file, loading it if needed.
+
+        Args:
+            path: The absolute path of the csv file.
+        Returns:
+            A weather.DateIndex of the file's rows.
+        """
+
+        source = os.stat(path)
+        version = (source.st_mtime_ns, source.st_size)
+
+        # Serve the warm copy if the file hasn't changed
+        cached = self.datasets.get(path)
+        if cached is not None and cached[0] == version:
+            self.datasets.move_to_end(path)
+            return cached[1]
+
+        # Share one load between every request that arrives while it runs
+        key = (path, version)
+        task = self.loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(path, version))
+            self.loading[key] = task
+            task.add_done_callback(lambda _: self.loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, path, version):
+        loop = asyncio.get_running_loop()
+        self.loads += 1
+        index = await loop.run_in_executor(self.executor, _load_index, path)
+        self.datasets[path] = (version, index)
+        self.datasets.move_to_end(path)
+        while len(self.datasets) > self.max_datasets:
+            self.datasets.popitem(last=False)
+        return index
+
+    async def summary(self, path, start=None, end=None):
+        """Builds generate_summary for a file and an optional date range.
+
+        Args:
+            path: The absolute path of the csv file.
+            start: The first date to include (ISO string), or None.
+            end: The first date to leave out (ISO string), or None.
+        Returns:
+            The summary text.
+        """
+
+        rows = (await self.dataset(path)).between(start, end)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, weather.generate_summary, rows)
+
+    async def daily_summary(self, path, start=None, end=None):
+        """Builds generate_daily_summary for a file and an optional date range.
+
+        Args:
+            path: The absolute path of the csv file.
+            start: The first date to include (ISO string), or None.
+            end: The first date to leave out (ISO string), or None.
+        Returns:
+            The daily summary text.
+        """
+
+        rows = (await self.dataset(path)).between(start, end)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, weather.generate_daily_summary, rows)
+
+    async def respond(self, method, target):
+        """Works out the reply to one request.
+
+        Args:
+            method: The HTTP method, e.g. "GET".
+            target: The request target, e.g. "/summary?path=a.csv".
+        Returns:
+            A tuple of (status, body text).
+        """
+
+        if method != "GET":
+            raise RequestError(405, "only GET is supported")
+        url = urlsplit(target)
+        handlers = {"/summary": self.summary, "/daily": self.daily_summary}
+        if url.path not in handlers:
+            raise RequestError(404, f"unknown endpoint: {url.path}")
+
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        path = self.resolve(query.get("path"))
+        for name in ("start", "end"):
+            if query.get(name) is not None:
+                try:
+                    datetime.fromisoformat(query[name])
+                except ValueError:
+                    raise RequestError(400, f"{name} must be an ISO date")
+
+        # Parse errors are not echoed back, as their messages quote the file's contents
+        try:
+            return 200, await handlers[url.path](path, query.get("start"), query.get("end"))
+        except (ValueError, IndexError):
+            raise RequestError(400, "the csv file could not be parsed")
+
+    async def handle(self, reader, writer):
+        """Serves a single HTTP connection (one request, then close).
+
+        Args:
+            reader: The connection's asyncio.StreamReader.
+            writer: The connection's asyncio.StreamWriter.
+        """
+
+        try:
+            try:
+                request_line = await _read_line(reader)
+                method, target, _ = request_line.split(" ", 2)
+
+                # Skip the headers; nothing in them is needed
+                while await _read_line(reader):
+                    pass
+
+                status, body = await self.respond(method, target)
+            except RequestError as error:
+                status, body = error.status, f"{error}\n"
+            except ValueError:
+                status, body = 400, "malformed request\n"
+            except Exception:
+                status, body = 500, "internal error\n"
+
+            payload = body.encode("utf8")
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                f"Content-Type: text/plain; charset=utf-8\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n\r\n".encode("ascii") + payload
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+# Reason phrases for the statuses the service sends
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+def _load_index(path):
+    """Parses a csv file into a DateIndex (runs in the executor).
+
+    Args:
+        path: The path of the csv file.
+    Returns:
+        A weather.DateIndex.
+    """
+
+    return weather.DateIndex(weather.load_data_from_csv(path, fast=True))
+
+
+async def _read_line(reader):
+    """Reads one CRLF-terminated line of an HTTP request.
+
+    Args:
+        reader: An asyncio.StreamReader.
+    Returns:
+        The line without its line ending ("" at the end of the headers).
+    """
+
+    line = await reader.readline()
+    if len(line) > MAX_LINE_LENGTH:
+        raise RequestError(400, "request line too long")
+    if not line:
+        raise ValueError("connection closed mid-request")
+    return line.decode("latin-1").rstrip("\r\n")
+
+
+async def serve(host="127.0.0.1", port=8000, service=None):
+    """Starts the HTTP service.
+
+    Args:
+        host: The address to listen on.
+        port: The port to listen on (0 picks a free one).
+        service: The WeatherService to use; a new one by default.
+    Returns:
+        The running asyncio.Server.
+    """
+
+    if service is None:
+        service = WeatherService()
+    return await asyncio.start_server(service.handle, host, port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve weather summaries over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--root", default=".", help="only serve csv files inside this directory (default: current directory)")
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = await serve(args.host, args.port, WeatherService(root=args.root))
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())